@@ -3,18 +3,509 @@ from PyQt5.QtWidgets import (
     QScrollArea, QComboBox, QMessageBox, QProgressDialog, QSizePolicy,
     QDialog, QListWidget, QListWidgetItem, QLineEdit, QHBoxLayout, QCheckBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread, QTimer
 from PyQt5.QtGui import QIcon
 from functools import partial
-import os, json, signal, requests, logging, re, shutil
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from requests.adapters import HTTPAdapter
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import os, sys, json, signal, requests, logging, re, shutil, urllib3, hashlib, mmap, sqlite3, threading, time, argparse, tempfile, multiprocessing, socket, ctypes
 
-logging.basicConfig(
-    filename="NSS_errors.log",
-    level=logging.ERROR,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
 __version__ = "1.0.16"
+SUNSHINE_DEFAULT_URL = "https://localhost:47990"
+COVER_JOBS_FILE = "NSS-cover-jobs.sqlite3"
+COVER_CACHE_FOLDER = "NSS-cover-cache"
+SCAN_CACHE_FILE = "NSS-scan-cache.sqlite3"
+COVER_JOB_MAX_ATTEMPTS = 5
+COVER_JOB_RETRY_DELAY = 60
+COVER_JOB_CLAIM_TIMEOUT = 600
+COVER_JOB_POLL_INTERVAL = 0.2
+COVER_WORKER_IDLE_INTERVAL = 1
+STEAMGRIDDB_API_URL = "https://www.steamgriddb.com/api/v2"
+LOG_FILE = "NSS_errors.log"
+LOG_JSON_FILE = "NSS_log.jsonl"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_SUBSYSTEMS = ("scan", "load", "covers", "ui", "sunshine", "batch")
+LOG_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+logger = logging.getLogger("NSS")
+scan_logger = logging.getLogger("NSS.scan")
+load_logger = logging.getLogger("NSS.load")
+covers_logger = logging.getLogger("NSS.covers")
+ui_logger = logging.getLogger("NSS.ui")
+sunshine_logger = logging.getLogger("NSS.sunshine")
+batch_logger = logging.getLogger("NSS.batch")
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "subsystem": record.name.partition(".")[2] or record.name,
+            "message": record.getMessage()
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in LOG_RECORD_FIELDS)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+def parse_log_levels(spec):
+    levels = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        subsystem, _, level = part.rpartition("=")
+        levels[subsystem.strip() or "*"] = level.strip().upper()
+    return levels
+
+def set_log_levels(levels):
+    valid_levels = {}
+    invalid = []
+    for subsystem, level in levels.items():
+        if subsystem != "*" and subsystem not in LOG_SUBSYSTEMS:
+            invalid.append(f"unknown subsystem '{subsystem}'")
+        elif not isinstance(logging.getLevelName(level), int):
+            invalid.append(f"unknown level '{level}' for '{subsystem}'")
+        else:
+            valid_levels[subsystem] = level
+    logger.setLevel(valid_levels.get("*", "ERROR"))
+    for subsystem in LOG_SUBSYSTEMS:
+        logging.getLogger(f"NSS.{subsystem}").setLevel(valid_levels.get(subsystem, logging.NOTSET))
+    for message in invalid:
+        logger.error("Ignoring log level setting: %s", message)
+
+def log_levels_from_config(config):
+    levels = {"*": "DEBUG"} if config.get("verbose_logging") else {}
+    levels.update(parse_log_levels(config.get("log_levels", "")))
+    levels.update(parse_log_levels(os.environ.get("NSS_LOG_LEVEL", "")))
+    return levels
+
+def configure_logging(config=None):
+    config = config or {}
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    max_bytes = config.get("log_max_bytes", LOG_MAX_BYTES)
+    file_handler = RotatingFileHandler(LOG_FILE, maxBytes=max_bytes, backupCount=LOG_BACKUP_COUNT, delay=True)
+    file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s"))
+    logger.addHandler(file_handler)
+    if config.get("log_json") or os.environ.get("NSS_LOG_JSON"):
+        json_handler = RotatingFileHandler(LOG_JSON_FILE, maxBytes=max_bytes, backupCount=LOG_BACKUP_COUNT, delay=True)
+        json_handler.setFormatter(JsonLinesFormatter())
+        logger.addHandler(json_handler)
+    logger.propagate = False
+    set_log_levels(log_levels_from_config(config))
+
+def load_config_file(config_file="NSS-config.json"):
+    if os.path.exists(config_file):
+        try:
+            with open(config_file, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            load_logger.error("Failed to load configuration: %s", e)
+    return {}
+
 FILTER_KEYWORDS = ['uninstall', 'setup', 'unins', 'unitycrashhandler64', 'crashpad_handler', 'unitycrashhandler32', 'vcredist_x64', 'vcredist_x642', 'vcredist_x643', 'vcredist_x86', 'vcredist_x862', 'vcredist_x863', 'vc_redist.x864', 'vc_redist.x644', 'oalinst', 'vc_redistx86', 'vc_redistx64', 'vc_redistx64']
+SPECIAL_IMAGES = {"Desktop": "desktop.png", "Steam Big Picture": "steam.png"}
+_exists_cache = {}
+
+def cached_exists(path):
+    if path not in _exists_cache:
+        _exists_cache[path] = os.path.exists(path)
+    return _exists_cache[path]
+
+def forget_path(path):
+    _exists_cache.pop(path, None)
+
+def write_file_atomically(path, data):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".part", delete=False) as f:
+        temp_path = f.name
+        try:
+            f.write(data)
+        except Exception:
+            f.close()
+            os.remove(temp_path)
+            raise
+    try:
+        os.replace(temp_path, path)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+def sanitize_cover_name(game_name):
+    return re.sub(r'[^a-zA-Z0-9 \- \.]', '', game_name)
+
+class CoversIndex:
+    def __init__(self, folder):
+        self.folder = os.path.normpath(folder)
+        self.covers = {}
+        self.scan()
+
+    def scan(self):
+        self.covers.clear()
+        try:
+            entries = list(os.scandir(self.folder))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith(".png"):
+                self.add_entry(entry.name, entry.stat())
+
+    def add_entry(self, name, stat):
+        self.covers[name.lower()] = {
+            "name": name,
+            "path": os.path.join(self.folder, name),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "last_used": stat.st_mtime,
+            "apps": set()
+        }
+
+    def add(self, path):
+        self.add_entry(os.path.basename(path), os.stat(path))
+
+    def has(self, name):
+        return name.lower() in self.covers
+
+    def total_size(self):
+        return sum(cover["size"] for cover in self.covers.values())
+
+    def set_references(self, apps):
+        for cover in self.covers.values():
+            cover["apps"].clear()
+        for app in apps:
+            image_path = (app.get("image-path") or "").strip("\"")
+            folder, name = os.path.split(image_path.replace("\\", "/"))
+            if name and os.path.normcase(os.path.normpath(folder)) == os.path.normcase(self.folder):
+                cover = self.covers.get(name.lower())
+                if cover:
+                    cover["apps"].add(app.get("name", "Unnamed App"))
+
+    def set_last_used(self, last_used):
+        for cover in self.covers.values():
+            recorded = last_used.get(cover_usage_key(cover["path"]))
+            if recorded is not None:
+                cover["last_used"] = max(cover["mtime"], recorded)
+
+    def plan_garbage_collection(self, quota_bytes=0):
+        doomed = [cover for cover in self.covers.values() if not cover["apps"]]
+        remaining = self.total_size() - sum(cover["size"] for cover in doomed)
+        if quota_bytes and remaining > quota_bytes:
+            referenced = sorted((cover for cover in self.covers.values() if cover["apps"]), key=lambda cover: cover["last_used"])
+            for cover in referenced:
+                if remaining <= quota_bytes:
+                    break
+                doomed.append(cover)
+                remaining -= cover["size"]
+        return doomed
+
+    def remove(self, covers):
+        removed = []
+        for cover in covers:
+            try:
+                os.remove(cover["path"])
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                covers_logger.error("Failed to remove cover %s: %s", cover["path"], e)
+                continue
+            self.covers.pop(cover["name"].lower(), None)
+            forget_path(cover["path"])
+            removed.append(cover)
+        return removed
+
+def cover_usage_key(image_path):
+    return os.path.normcase(os.path.abspath(image_path.strip("\"").replace("\\", "/")))
+
+_covers_indexes = {}
+
+def get_covers_index(folder):
+    key = os.path.normcase(os.path.normpath(folder))
+    if key not in _covers_indexes:
+        _covers_indexes[key] = CoversIndex(folder)
+    return _covers_indexes[key]
+
+def reset_covers_indexes():
+    _covers_indexes.clear()
+
+def cover_needs_refresh(app, fresh=False):
+    name = app.get("name", "")
+    if name in SPECIAL_IMAGES:
+        return app.get("image-path") != SPECIAL_IMAGES[name]
+    image_path = (app.get("image-path") or "").strip("\"")
+    folder, file_name = os.path.split(image_path.replace("\\", "/"))
+    if not image_path or file_name not in {f"{name}.png", f"{sanitize_cover_name(name)}.png"}:
+        return True
+    if os.path.basename(folder).lower() == "covers":
+        return not get_covers_index(folder).has(file_name)
+    if fresh:
+        forget_path(image_path)
+    return not cached_exists(image_path)
+
+ACF_TOKEN_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"|([{}])')
+
+def parse_acf(text):
+    root = {}
+    stack = [root]
+    key = None
+    for match in ACF_TOKEN_PATTERN.finditer(text):
+        value, brace = match.groups()
+        if brace == "{":
+            child = {}
+            if key is not None:
+                stack[-1][key] = child
+            stack.append(child)
+            key = None
+        elif brace == "}":
+            if len(stack) > 1:
+                stack.pop()
+            key = None
+        elif key is None:
+            key = value
+        else:
+            stack[-1][key] = re.sub(r'\\(.)', r'\1', value)
+            key = None
+    return root
+
+def read_steam_manifests(base_folder):
+    base_folder = os.path.normpath(base_folder)
+    steamapps = os.path.dirname(base_folder)
+    if os.path.basename(base_folder).lower() != "common" or os.path.basename(steamapps).lower() != "steamapps":
+        return {}
+    manifests = {}
+    try:
+        entries = list(os.scandir(steamapps))
+    except OSError as e:
+        scan_logger.warning("Failed to list Steam library %s: %s", steamapps, e)
+        return manifests
+    for entry in entries:
+        if not (entry.name.startswith("appmanifest_") and entry.name.endswith(".acf")):
+            continue
+        try:
+            with open(entry.path, "r", encoding="utf-8", errors="replace") as f:
+                app_state = parse_acf(f.read()).get("AppState", {})
+        except OSError as e:
+            scan_logger.warning("Failed to read Steam manifest %s: %s", entry.path, e)
+            continue
+        install_dir = app_state.get("installdir")
+        if install_dir and app_state.get("appid"):
+            manifests[install_dir.lower()] = {
+                "name": app_state.get("name") or install_dir,
+                "appid": app_state["appid"]
+            }
+    return manifests
+
+HASH_BLOCK_SIZE = 64 * 1024
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+def partial_file_hash(path):
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            digest = hashlib.blake2b(mm[:HASH_BLOCK_SIZE])
+            if size > HASH_BLOCK_SIZE:
+                digest.update(mm[max(HASH_BLOCK_SIZE, size - HASH_BLOCK_SIZE):])
+    return digest.hexdigest()
+
+def full_file_hash(path, cancel_event=None):
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                for offset in range(0, len(mm), HASH_CHUNK_SIZE):
+                    if cancel_event is not None and cancel_event.is_set():
+                        return None
+                    digest.update(view[offset:offset + HASH_CHUNK_SIZE])
+            finally:
+                view.release()
+    return digest.hexdigest()
+
+def _safe_hash(hash_function, path):
+    try:
+        return hash_function(path)
+    except (OSError, ValueError) as e:
+        scan_logger.warning("Failed to hash %s: %s", path, e)
+        return None
+
+def _group_by_hash(keyed_paths, hash_function, pool, on_hashed):
+    groups = defaultdict(list)
+    pending = {pool.submit(_safe_hash, hash_function, path): (key, path) for key, path in keyed_paths}
+    while pending:
+        done, _ = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+        for future in done:
+            key, path = pending.pop(future)
+            digest = future.result()
+            if digest is not None:
+                groups[(key, digest)].append(path)
+        if not on_hashed(len(done)):
+            for future in pending:
+                future.cancel()
+            return None
+    return [group for group in groups.values() if len(group) > 1]
+
+def find_duplicate_files(paths, max_workers=None, progress=None):
+    by_size = defaultdict(list)
+    for path in set(paths):
+        try:
+            by_size[os.path.getsize(path)].append(path)
+        except OSError as e:
+            scan_logger.warning("Failed to stat %s: %s", path, e)
+    candidates = [(size, path) for size, group in by_size.items() if size and len(group) > 1 for path in group]
+    if not candidates:
+        return []
+    cancel_event = threading.Event()
+    hashed = 0
+    total = len(candidates)
+    def on_hashed(count):
+        nonlocal hashed
+        hashed += count
+        if progress is None or progress(hashed, total):
+            return True
+        cancel_event.set()
+        return False
+    duplicates = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        partial_groups = _group_by_hash(candidates, partial_file_hash, pool, on_hashed)
+        if partial_groups is None:
+            return None
+        needs_full_hash = []
+        for group in partial_groups:
+            size = os.path.getsize(group[0])
+            if size <= 2 * HASH_BLOCK_SIZE:
+                duplicates.append(sorted(group))
+            else:
+                needs_full_hash.extend((size, path) for path in group)
+        total += len(needs_full_hash)
+        full_groups = _group_by_hash(needs_full_hash, partial(full_file_hash, cancel_event=cancel_event), pool, on_hashed)
+        if full_groups is None:
+            return None
+        duplicates.extend(sorted(group) for group in full_groups)
+    return sorted(duplicates)
+
+def walk_executables(folder):
+    exe_files = set()
+    dir_mtimes = {}
+    pending = [folder]
+    while pending:
+        directory = pending.pop()
+        try:
+            dir_mtimes[directory] = os.stat(directory).st_mtime
+            entries = list(os.scandir(directory))
+        except OSError as e:
+            scan_logger.warning("Failed to scan %s: %s", directory, e)
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                pending.append(entry.path)
+            elif entry.name.endswith(".exe") and not any(kw in entry.name.lower() for kw in FILTER_KEYWORDS):
+                exe_files.add(os.path.normpath(entry.path))
+    return exe_files, dir_mtimes
+
+def find_executables(folder):
+    return walk_executables(folder)[0]
+
+def normalize_game_name(name):
+    return re.sub(r'[^a-z0-9]', '', (name or "").lower())
+
+def games_match(first, second):
+    if first.get("steam_appid") and second.get("steam_appid"):
+        return str(first["steam_appid"]) == str(second["steam_appid"])
+    if normalize_game_name(first["name"]) and normalize_game_name(first["name"]) == normalize_game_name(second["name"]):
+        return True
+    return os.path.basename(first["exe"]).lower() == os.path.basename(second["exe"]).lower()
+
+def confirm_duplicate_games(duplicates, identities):
+    confirmed = []
+    for group in duplicates:
+        clusters = []
+        for path in group:
+            matching = [cluster for cluster in clusters if any(games_match(identities[path], identities[other]) for other in cluster)]
+            for cluster in matching:
+                clusters.remove(cluster)
+            clusters.append(sorted([path] + [other for cluster in matching for other in cluster]))
+        confirmed.extend(cluster for cluster in clusters if len(cluster) > 1)
+    return sorted(confirmed)
+
+def build_app_entry(base_folder, subfolder_path, data):
+    if base_folder == "Special" and data["selected_exe"] == "Include":
+        return {
+            "name": data["name"],
+            "cmd": None,
+            "exclude-global-prep-cmd": "false",
+            "elevated": "false",
+            "auto-detach": "false",
+            "wait-all": "true",
+            "exit-timeout": "5",
+            "image-path": data.get("image-path", ""),
+            "working-dir": None
+        }
+    return {
+        "name": data.get("name", os.path.basename(subfolder_path)),
+        "cmd": "\"" + data["selected_exe"].replace("/", "\\") + "\"",
+        "exclude-global-prep-cmd": "false",
+        "elevated": "false",
+        "auto-detach": "false",
+        "wait-all": "true",
+        "exit-timeout": "5",
+        "image-path": "\"" + data.get("image-path", subfolder_path).replace("/", "\\") + "\"",
+        "working-dir": "\"" + data.get("working-dir", subfolder_path).replace("/", "\\") + "\""
+    }
+
+class SearchIndex:
+    def __init__(self):
+        self.entries = {}
+        self.rows = None
+        self.last_query = None
+        self.last_matches = None
+
+    def clear(self):
+        self.entries.clear()
+        self.rows = None
+        self.last_query = None
+        self.last_matches = None
+
+    def add(self, key, name, *fields):
+        name = name or ""
+        self.entries[key] = (name.lower(), "\n".join([name] + [field for field in fields if field]).lower())
+        self.rows = None
+        self.last_query = None
+
+    def remove(self, key):
+        self.entries.pop(key, None)
+        self.rows = None
+        self.last_query = None
+
+    def search(self, query):
+        query = query.strip().lower()
+        terms = query.split()
+        if not terms:
+            self.last_query = None
+            return set(self.entries)
+        if self.last_query and query.startswith(self.last_query):
+            candidates = self.last_matches
+        else:
+            if self.rows is None:
+                self.rows = [(key, name, haystack) for key, (name, haystack) in self.entries.items()]
+            candidates = self.rows
+        for term in terms:
+            if term.startswith("^"):
+                prefix = term[1:]
+                candidates = [entry for entry in candidates if entry[1].startswith(prefix)]
+            else:
+                candidates = [entry for entry in candidates if term in entry[2]]
+        self.last_query = query
+        self.last_matches = candidates
+        return {entry[0] for entry in candidates}
+
 class ConfigDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -27,6 +518,25 @@ class ConfigDialog(QDialog):
         self.cover_checkbox = QCheckBox("Download Covers")
         self.cover_checkbox.setChecked(True)
         self.layout().addWidget(self.cover_checkbox)
+        self.sunshine_url_edit = QLineEdit()
+        self.sunshine_url_edit.setPlaceholderText(SUNSHINE_DEFAULT_URL)
+        self.layout().addWidget(QLabel("Sunshine URL:"))
+        self.layout().addWidget(self.sunshine_url_edit)
+        self.sunshine_user_edit = QLineEdit()
+        self.sunshine_user_edit.setPlaceholderText("Enter Sunshine username")
+        self.layout().addWidget(QLabel("Sunshine Username:"))
+        self.layout().addWidget(self.sunshine_user_edit)
+        self.sunshine_password_edit = QLineEdit()
+        self.sunshine_password_edit.setPlaceholderText("Enter Sunshine password")
+        self.sunshine_password_edit.setEchoMode(QLineEdit.Password)
+        self.layout().addWidget(QLabel("Sunshine Password:"))
+        self.layout().addWidget(self.sunshine_password_edit)
+        self.covers_quota_edit = QLineEdit()
+        self.covers_quota_edit.setPlaceholderText("0 = unlimited")
+        self.layout().addWidget(QLabel("Covers Folder Quota (MB):"))
+        self.layout().addWidget(self.covers_quota_edit)
+        self.verbose_checkbox = QCheckBox("Verbose Logging")
+        self.layout().addWidget(self.verbose_checkbox)
         save_button = QPushButton("Save")
         save_button.clicked.connect(self.save_config)
         self.layout().addWidget(save_button)
@@ -34,48 +544,562 @@ class ConfigDialog(QDialog):
         self.load_config()
         
     def load_config(self):
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, "r") as f:
-                    config = json.load(f)
-                    self.api_key_edit.setText(config.get("api_key", ""))
-                    self.cover_checkbox.setChecked(config.get("download_covers", True))
-            except Exception as e:
-                logging.error(f"Failed to load configuration: {e}")
+        config = load_config_file(self.config_file)
+        self.api_key_edit.setText(config.get("api_key", ""))
+        self.cover_checkbox.setChecked(config.get("download_covers", True))
+        self.sunshine_url_edit.setText(config.get("sunshine_url", ""))
+        self.sunshine_user_edit.setText(config.get("sunshine_username", ""))
+        self.sunshine_password_edit.setText(config.get("sunshine_password", ""))
+        self.covers_quota_edit.setText(str(config.get("covers_quota_mb", 0)))
+        self.verbose_checkbox.setChecked(config.get("verbose_logging", False))
 
     def save_config(self):
-        config = {
-            "api_key": self.api_key_edit.text(),
-            "download_covers": self.cover_checkbox.isChecked()
-        }
+        config = load_config_file(self.config_file)
+        config.update(self.get_config())
         try:
             with open(self.config_file, "w") as f:
                 json.dump(config, f, indent=4)
-            logging.info("Configuration saved successfully.")
+            set_log_levels(log_levels_from_config(config))
+            ui_logger.info("Configuration saved successfully.")
             QMessageBox.information(self, "Success", "Configuration saved!")
             self.accept()
         except Exception as e:
-            logging.error(f"Failed to save configuration: {e}")
+            ui_logger.error("Failed to save configuration: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to save configuration: {e}")
 
     def get_config(self):
         return {
             "api_key": self.api_key_edit.text(),
-            "download_covers": self.cover_checkbox.isChecked()
+            "download_covers": self.cover_checkbox.isChecked(),
+            "sunshine_url": self.sunshine_url_edit.text().strip(),
+            "sunshine_username": self.sunshine_user_edit.text(),
+            "sunshine_password": self.sunshine_password_edit.text(),
+            "covers_quota_mb": int(self.covers_quota_edit.text()) if self.covers_quota_edit.text().strip().isdigit() else 0,
+            "verbose_logging": self.verbose_checkbox.isChecked()
         }
 
+def _sunshine_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+def sunshine_app_matches(remote_app, app):
+    return all(_sunshine_value(remote_app.get(key)) == _sunshine_value(value) for key, value in app.items() if key != "index")
+
+def _plan_slot_updates(remote_apps, apps):
+    mirror = list(remote_apps)
+    wanted = Counter(app.get("name") for app in apps)
+    available = Counter(app.get("name") for app in mirror)
+    seen = Counter()
+    gone = []
+    for index, app in enumerate(mirror):
+        seen[app.get("name")] += 1
+        if seen[app.get("name")] > wanted[app.get("name")]:
+            gone.append(index)
+    seen = Counter()
+    new = []
+    for app in apps:
+        seen[app.get("name")] += 1
+        if seen[app.get("name")] > available[app.get("name")]:
+            new.append(app)
+    operations = []
+    reused = min(len(gone), len(new))
+    for index in sorted(gone[reused:], reverse=True):
+        operations.append(("delete", index, mirror[index]))
+        del mirror[index]
+    for app in new[reused:]:
+        operations.append(("add", -1, app))
+        mirror.append(app)
+    for index, app in enumerate(apps):
+        if not sunshine_app_matches(mirror[index], app):
+            operations.append(("update", index, app))
+            mirror[index] = app
+    return operations
+
+def _plan_prefix_rebuild(remote_apps, apps):
+    kept = []
+    for index, app in enumerate(remote_apps):
+        if len(kept) < len(apps) and app.get("name") == apps[len(kept)].get("name"):
+            kept.append(index)
+    kept_indexes = set(kept)
+    operations = [("delete", index, remote_apps[index]) for index in reversed(range(len(remote_apps))) if index not in kept_indexes]
+    for slot, index in enumerate(kept):
+        if not sunshine_app_matches(remote_apps[index], apps[slot]):
+            operations.append(("update", slot, apps[slot]))
+    operations.extend(("add", -1, app) for app in apps[len(kept):])
+    return operations
+
+def diff_sunshine_apps(remote_apps, apps):
+    return min(_plan_slot_updates(remote_apps, apps), _plan_prefix_rebuild(remote_apps, apps), key=len)
+
+class SunshineAPIClient:
+    def __init__(self, base_url=None, username="", password="", verify=False, timeout=10):
+        self.base_url = (base_url or SUNSHINE_DEFAULT_URL).rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=2)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Connection"] = "keep-alive"
+        self.session.verify = verify
+        if username:
+            self.session.auth = (username, password)
+        if not verify:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            config.get("sunshine_url") or SUNSHINE_DEFAULT_URL,
+            config.get("sunshine_username", ""),
+            config.get("sunshine_password", "")
+        )
+
+    def get_apps(self):
+        response = self.session.get(f"{self.base_url}/api/apps", timeout=self.timeout)
+        response.raise_for_status()
+        return response.json().get("apps", [])
+
+    def save_app(self, app, index=-1):
+        payload = dict(app)
+        payload["index"] = index
+        response = self.session.post(f"{self.base_url}/api/apps", json=payload, timeout=self.timeout)
+        response.raise_for_status()
+
+    def delete_app(self, index):
+        response = self.session.delete(f"{self.base_url}/api/apps/{index}", timeout=self.timeout)
+        response.raise_for_status()
+
+    def push_apps(self, apps):
+        operations = diff_sunshine_apps(self.get_apps(), apps)
+        for action, index, app in operations:
+            if action == "delete":
+                self.delete_app(index)
+            else:
+                self.save_app(app, index)
+            sunshine_logger.info("Sunshine %s at index %s: %s", action, index, app.get("name"), extra={"action": action, "index": index, "app": app.get("name")})
+        return operations
+
+    def close(self):
+        self.session.close()
+
+class SteamGridDBClient:
+    acceptable_sizes = [(600, 900), (342, 482)]
+
+    def __init__(self, api_key, timeout=30):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {api_key}"
+
+    def get_json(self, path):
+        response = self.session.get(f"{STEAMGRIDDB_API_URL}/{path}", timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def lookup_steam_game_id(self, steam_appid):
+        try:
+            return self.get_json(f"games/steam/{steam_appid}").get("data", {}).get("id")
+        except requests.RequestException as e:
+            covers_logger.warning("No SteamGridDB game for Steam app %s, falling back to search: %s", steam_appid, e)
+        return None
+
+    def search_game_id(self, game_name):
+        results = self.get_json(f"search/autocomplete/{sanitize_cover_name(game_name)}").get("data", [])
+        covers_logger.debug("SteamGridDB response for %s: %s", game_name, results)
+        return results[0]["id"] if results else None
+
+    def resolve_game_id(self, game_name, steam_appid=None):
+        if steam_appid:
+            game_id = self.lookup_steam_game_id(steam_appid)
+            if game_id:
+                return game_id
+        return self.search_game_id(game_name)
+
+    def download_cover(self, game_id, game_name, image_dir):
+        grids = self.get_json(f"grids/game/{game_id}").get("data", [])
+        covers_logger.debug("Grid data for %s: %s", game_name, grids)
+        valid_grids = [
+            grid for grid in grids
+            if (grid.get("width"), grid.get("height")) in self.acceptable_sizes
+        ]
+        if not valid_grids:
+            covers_logger.warning("No valid cover art sizes found for %s.", game_name)
+            return None
+        response = self.session.get(valid_grids[0]["url"], timeout=self.timeout)
+        response.raise_for_status()
+        png_path = os.path.join(image_dir, f"{sanitize_cover_name(game_name)}.png")
+        write_file_atomically(png_path, response.content)
+        covers_logger.info("Image saved as PNG for %s at %s", game_name, png_path, extra={"game": game_name, "game_id": game_id, "path": png_path})
+        return png_path
+
+    def close(self):
+        self.session.close()
+
+def process_alive(pid):
+    if os.name == "nt":
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return kernel32.GetLastError() == 5
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == 259
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+def cover_job_owner():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def claim_owner_alive(owner):
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+    return process_alive(int(pid))
+
+class CoverJobQueue:
+    def __init__(self, path=COVER_JOBS_FILE):
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.lock, self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    image_dir TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    steam_appid TEXT,
+                    game_id INTEGER,
+                    state TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt REAL NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    image_path TEXT,
+                    updated REAL NOT NULL,
+                    claimed_at REAL,
+                    claimed_by TEXT,
+                    PRIMARY KEY (image_dir, name)
+                )
+            """)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS cover_usage (path TEXT PRIMARY KEY, last_used REAL NOT NULL)"
+            )
+            columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(jobs)")}
+            for column, column_type in (("claimed_at", "REAL"), ("claimed_by", "TEXT")):
+                if column not in columns:
+                    self.connection.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+        self.connection.create_function("claim_owner_alive", 1, claim_owner_alive)
+
+    def enqueue_many(self, jobs):
+        now = time.time()
+        with self.lock, self.connection:
+            for image_dir, name, steam_appid in jobs:
+                row = self.connection.execute(
+                    "SELECT state, image_path FROM jobs WHERE image_dir = ? AND name = ?", (image_dir, name)
+                ).fetchone()
+                if row is None:
+                    self.connection.execute(
+                        "INSERT OR IGNORE INTO jobs (image_dir, name, steam_appid, updated) VALUES (?, ?, ?, ?)",
+                        (image_dir, name, steam_appid, now)
+                    )
+                elif row["state"] == "done" and not os.path.exists(row["image_path"] or ""):
+                    self.connection.execute(
+                        "UPDATE jobs SET state = CASE WHEN game_id IS NULL THEN 'pending' ELSE 'resolved' END, "
+                        "image_path = NULL, updated = ? WHERE image_dir = ? AND name = ?",
+                        (now, image_dir, name)
+                    )
+
+    def get(self, image_dir, name):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT * FROM jobs WHERE image_dir = ? AND name = ?", (image_dir, name)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def claimable_condition(self, due_only):
+        now = time.time()
+        condition = (
+            "(state IN ('pending', 'resolved') "
+            "OR (state = 'running' AND (claimed_at < ? OR claimed_by IS NULL OR NOT claim_owner_alive(claimed_by))) "
+            "OR (state = 'failed' AND attempts < ?"
+        )
+        parameters = [now - COVER_JOB_CLAIM_TIMEOUT, COVER_JOB_MAX_ATTEMPTS]
+        if due_only:
+            condition += " AND next_attempt <= ?"
+            parameters.append(now)
+        return condition + "))", parameters
+
+    def claim(self, job, due_only=False):
+        condition, parameters = self.claimable_condition(due_only)
+        now = time.time()
+        with self.lock, self.connection:
+            claimed = self.connection.execute(
+                f"UPDATE jobs SET state = 'running', claimed_at = ?, claimed_by = ?, updated = ? WHERE image_dir = ? AND name = ? AND {condition}",
+                (now, cover_job_owner(), now, job["image_dir"], job["name"], *parameters)
+            ).rowcount == 1
+        return self.get(job["image_dir"], job["name"]) if claimed else None
+
+    def claim_next(self):
+        while True:
+            condition, parameters = self.claimable_condition(due_only=True)
+            with self.lock:
+                row = self.connection.execute(
+                    f"SELECT * FROM jobs WHERE {condition} ORDER BY updated LIMIT 1", parameters
+                ).fetchone()
+            if row is None:
+                return None
+            job = self.claim(dict(row), due_only=True)
+            if job is not None:
+                return job
+
+    def update(self, job, **fields):
+        fields["updated"] = time.time()
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        with self.lock, self.connection:
+            self.connection.execute(
+                f"UPDATE jobs SET {assignments} WHERE image_dir = ? AND name = ?",
+                (*fields.values(), job["image_dir"], job["name"])
+            )
+        job.update(fields)
+
+    def mark_resolved(self, job, game_id):
+        self.update(job, game_id=game_id, last_error=None)
+
+    def mark_done(self, job, image_path):
+        self.update(job, image_path=image_path, state="done", last_error=None)
+
+    def mark_failed(self, job, error, permanent=False):
+        attempts = COVER_JOB_MAX_ATTEMPTS if permanent else job["attempts"] + 1
+        delay = COVER_JOB_RETRY_DELAY * 2 ** (attempts - 1)
+        self.update(job, state="failed", attempts=attempts, next_attempt=time.time() + delay, last_error=error)
+
+    def retry_failed(self):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE jobs SET state = CASE WHEN game_id IS NULL THEN 'pending' ELSE 'resolved' END, "
+                "attempts = 0, next_attempt = 0, updated = ? WHERE state = 'failed'",
+                (time.time(),)
+            )
+
+    def next_attempt_time(self):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT MIN(next_attempt) FROM jobs WHERE state = 'failed' AND attempts < ?", (COVER_JOB_MAX_ATTEMPTS,)
+            ).fetchone()
+        return row[0]
+
+    def record_cover_usage(self, paths):
+        now = time.time()
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO cover_usage (path, last_used) VALUES (?, ?)", ((path, now) for path in set(paths))
+            )
+
+    def cover_usage(self):
+        with self.lock:
+            rows = self.connection.execute("SELECT path, last_used FROM cover_usage").fetchall()
+        return {path: last_used for path, last_used in rows}
+
+    def counts(self):
+        with self.lock:
+            rows = self.connection.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return {state: count for state, count in rows}
+
+    def failed_jobs(self):
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT * FROM jobs WHERE state = 'failed' ORDER BY name"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        self.connection.close()
+
+def remember_cover_usage(apps, jobs_file=COVER_JOBS_FILE):
+    try:
+        queue = CoverJobQueue(jobs_file)
+        try:
+            queue.record_cover_usage(cover_usage_key(app["image-path"]) for app in apps if app.get("image-path"))
+        finally:
+            queue.close()
+    except sqlite3.Error as e:
+        covers_logger.warning("Failed to record cover usage: %s", e)
+
+def process_cover_job(queue, client, job):
+    try:
+        if job["game_id"] is None:
+            game_id = client.resolve_game_id(job["name"], job["steam_appid"])
+            if not game_id:
+                queue.mark_failed(job, "No SteamGridDB match", permanent=True)
+                return None
+            queue.mark_resolved(job, game_id)
+        image_path = client.download_cover(job["game_id"], job["name"], job["image_dir"])
+        if not image_path:
+            queue.mark_failed(job, "No cover in an accepted size", permanent=True)
+            return None
+        queue.mark_done(job, image_path)
+        return image_path
+    except Exception as e:
+        covers_logger.error("Failed to fetch cover for %s: %s", job["name"], e)
+        queue.mark_failed(job, str(e))
+    return None
+
+def fetch_cover(queue, client, image_dir, name, wait=None):
+    while True:
+        job = queue.get(image_dir, name)
+        if job["state"] == "done":
+            return job["image_path"]
+        claimed = queue.claim(job)
+        if claimed is not None:
+            covers_logger.debug("Fetching new cover for: %s", name)
+            return process_cover_job(queue, client, claimed)
+        state = queue.get(image_dir, name)["state"]
+        if state == "done":
+            continue
+        if state != "running":
+            return None
+        if wait is None:
+            time.sleep(COVER_JOB_POLL_INTERVAL)
+        elif not wait():
+            return None
+
+class CoverWorker(QThread):
+    def __init__(self, api_key, parent=None):
+        super().__init__(parent)
+        self.api_key = api_key
+
+    def run(self):
+        queue = CoverJobQueue()
+        client = SteamGridDBClient(self.api_key)
+        try:
+            while not self.isInterruptionRequested():
+                job = queue.claim_next()
+                if job:
+                    process_cover_job(queue, client, job)
+                    continue
+                next_attempt = queue.next_attempt_time()
+                if next_attempt is None:
+                    break
+                self.msleep(int(min(max(next_attempt - time.time(), 0), COVER_WORKER_IDLE_INTERVAL) * 1000))
+        finally:
+            client.close()
+            queue.close()
+
+_cover_worker = None
+
+def start_cover_worker(api_key):
+    global _cover_worker
+    if not api_key or (_cover_worker is not None and _cover_worker.isRunning()):
+        return _cover_worker
+    _cover_worker = CoverWorker(api_key)
+    _cover_worker.start()
+    return _cover_worker
+
+def stop_cover_worker():
+    if _cover_worker is not None and _cover_worker.isRunning():
+        _cover_worker.requestInterruption()
+        _cover_worker.wait()
+
+def cover_worker_running():
+    return _cover_worker is not None and _cover_worker.isRunning()
+
+class CoverJobsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Cover Jobs")
+        self.setLayout(QVBoxLayout())
+        self.queue = CoverJobQueue()
+        self.counts_label = QLabel()
+        self.layout().addWidget(self.counts_label)
+        self.failed_list = QListWidget()
+        self.layout().addWidget(QLabel("Failed:"))
+        self.layout().addWidget(self.failed_list)
+        buttons_layout = QHBoxLayout()
+        resume_button = QPushButton("Resume")
+        resume_button.clicked.connect(self.resume)
+        buttons_layout.addWidget(resume_button)
+        retry_button = QPushButton("Retry Failed")
+        retry_button.clicked.connect(self.retry_failed)
+        buttons_layout.addWidget(retry_button)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        buttons_layout.addWidget(close_button)
+        self.layout().addLayout(buttons_layout)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+        self.finished.connect(self.cleanup)
+        self.refresh()
+
+    def refresh(self):
+        counts = self.queue.counts()
+        queued = counts.get("pending", 0) + counts.get("resolved", 0) + counts.get("running", 0)
+        status = "running" if cover_worker_running() else "idle"
+        self.counts_label.setText(
+            f"Queued: {queued}    Failed: {counts.get('failed', 0)}    Finished: {counts.get('done', 0)}    Worker: {status}"
+        )
+        self.failed_list.clear()
+        for job in self.queue.failed_jobs():
+            retry = "gave up" if job["attempts"] >= COVER_JOB_MAX_ATTEMPTS else f"attempt {job['attempts']}"
+            self.failed_list.addItem(f"{job['name']} ({retry}): {job['last_error']}")
+
+    def resume(self):
+        api_key = load_config_file().get("api_key")
+        if not api_key:
+            QMessageBox.warning(self, "Configuration Error", "SteamGridDB API Key is missing. Please configure the settings.")
+            return
+        start_cover_worker(api_key)
+        self.refresh()
+
+    def retry_failed(self):
+        self.queue.retry_failed()
+        self.resume()
+
+    def cleanup(self):
+        self.timer.stop()
+        self.queue.close()
+
 class SortDialog(QDialog):
-    def __init__(self, apps, json_file_path, parent=None):
+    def __init__(self, apps, json_file_path, parent=None, dirty_names=None, steam_appids=None):
         super().__init__(parent)
         self.apps = apps
+        self.steam_appids = dict(steam_appids or {})
+        self.apps_by_name = {}
+        for app in apps:
+            self.apps_by_name.setdefault(app.get("name", "Unnamed App"), app)
+        if dirty_names is None:
+            dirty_names = {app.get("name", "Unnamed App") for app in apps if cover_needs_refresh(app)}
+        self.dirty_names = set(dirty_names)
         self.setWindowTitle(f"Sort Applications - {len(self.apps)} Apps Loaded")
         self.json_file_path = json_file_path
+        self.covers_location = None
         self.cmd_edits = {}
         self.config_dialog = ConfigDialog(self)
         self.config = self.config_dialog.get_config()
         self.download_covers = self.config.get("download_covers", False)
         layout = QVBoxLayout()
         self.setLayout(layout)
+        filter_layout = QHBoxLayout()
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter apps (use ^ for name prefix)...")
+        self.filter_edit.textChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.filter_edit)
+        self.filter_combo = NoScrollComboBox()
+        self.filter_combo.addItems(["All", "Missing Cover", "Unsaved Changes"])
+        self.filter_combo.currentTextChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.filter_combo)
+        layout.addLayout(filter_layout)
+        self.search_index = SearchIndex()
+        self.list_items = {}
         self.list_widget = QListWidget(self)
         self.list_widget.setDragDropMode(QListWidget.InternalMove)
         self.list_widget.model().rowsMoved.connect(self.refresh_drag_handles)
@@ -85,6 +1109,8 @@ class SortDialog(QDialog):
             list_item.setSizeHint(item_widget.sizeHint())
             self.list_widget.addItem(list_item)
             self.list_widget.setItemWidget(list_item, item_widget)
+            self.list_items[id(app)] = (app, list_item)
+            self.index_app(app)
         layout.addWidget(self.list_widget)
         config_button = QPushButton("Configure")
         config_button.setFocusPolicy(Qt.NoFocus)
@@ -94,6 +1120,10 @@ class SortDialog(QDialog):
         save_button.setFocusPolicy(Qt.NoFocus)
         save_button.clicked.connect(self.save_sorted_json)
         layout.addWidget(save_button)
+        push_button = QPushButton("Push to Sunshine")
+        push_button.setFocusPolicy(Qt.NoFocus)
+        push_button.clicked.connect(self.push_to_sunshine)
+        layout.addWidget(push_button)
         self.showMaximized()
 
     def open_config_dialog(self):
@@ -152,10 +1182,7 @@ class SortDialog(QDialog):
                     if old_name in self.cmd_edits:
                         self.cmd_edits[updated_name] = self.cmd_edits.pop(old_name)
                         self.cmd_edits[updated_name]["name_edit"] = name_edit
-                    for app_item in self.apps:
-                        if app_item.get("name") == old_name:
-                            app_item["name"] = updated_name
-                            break
+                    self.rename_app(old_name, updated_name)
             else:
                 name_edit.setText(name_label.text())
                 name_label.setVisible(False)
@@ -172,10 +1199,7 @@ class SortDialog(QDialog):
                 if old_name in self.cmd_edits:
                     self.cmd_edits[updated_name] = self.cmd_edits.pop(old_name)
                     self.cmd_edits[updated_name]["name_edit"] = name_edit
-                for app_item in self.apps:
-                    if app_item.get("name") == old_name:
-                        app_item["name"] = updated_name
-                        break
+                self.rename_app(old_name, updated_name)
 
         name_edit.editingFinished.connect(save_name)
 
@@ -189,17 +1213,49 @@ class SortDialog(QDialog):
             updated_cmd = cmd_edit.text().strip()
             if updated_cmd:
                 app["cmd"] = updated_cmd
-                for app_item in self.apps:
-                    if app_item.get("name") == app.get("name"):
-                        app_item["cmd"] = updated_cmd
-                        break
+                app_item = self.apps_by_name.get(name_label.text())
+                if app_item is not None:
+                    app_item["cmd"] = updated_cmd
+                    self.index_app(app_item)
+                self.dirty_names.add(name_label.text())
             cmd_edit.setVisible(False)
 
         cmd_edit.editingFinished.connect(save_command)
+        self.cmd_edits[app.get("name", "Unnamed App")].update(save_name=save_name, save_command=save_command)
         name_label.mousePressEvent = lambda event: toggle_name_edit()
         edit_button.clicked.connect(toggle_cmd_edit)
         return widget
 
+    def index_app(self, app):
+        self.search_index.add(id(app), app.get("name", "Unnamed App"), app.get("working-dir"), app.get("cmd"))
+
+    def apply_filter(self, *args):
+        matches = self.search_index.search(self.filter_edit.text())
+        mode = self.filter_combo.currentText()
+        self.list_widget.setUpdatesEnabled(False)
+        for key, (app, list_item) in self.list_items.items():
+            visible = key in matches
+            if visible and mode == "Missing Cover":
+                visible = cover_needs_refresh(app)
+            elif visible and mode == "Unsaved Changes":
+                visible = app.get("name", "Unnamed App") in self.dirty_names
+            if list_item.isHidden() == visible:
+                list_item.setHidden(not visible)
+        self.list_widget.setUpdatesEnabled(True)
+
+    def rename_app(self, old_name, updated_name):
+        if old_name == updated_name:
+            return
+        app_item = self.apps_by_name.pop(old_name, None)
+        if app_item is not None:
+            app_item["name"] = updated_name
+            self.apps_by_name[updated_name] = app_item
+            self.index_app(app_item)
+        self.dirty_names.discard(old_name)
+        self.dirty_names.add(updated_name)
+        if old_name in self.steam_appids:
+            self.steam_appids[updated_name] = self.steam_appids.pop(old_name)
+
     def refresh_drag_handles(self, source_parent, source_start, source_end, destination_parent, destination_row):
         for i in range(self.list_widget.count()):
             list_item = self.list_widget.item(i)
@@ -212,129 +1268,168 @@ class SortDialog(QDialog):
         if config_dialog.exec_():
             self.config = config_dialog.get_config()
 
-    def save_sorted_json(self):
+    def ensure_json_file_path(self):
         if not self.json_file_path:
             self.json_file_path, _ = QFileDialog.getSaveFileName(self, "Save Sorted JSON", "", "JSON Files (*.json)")
             if not self.json_file_path:
                 QMessageBox.warning(self, "No File Selected", "Please select a file to save the sorted configuration.")
-                return
+                return False
+        return True
+
+    def commit_pending_edits(self, name):
+        app_fields = self.cmd_edits.get(name)
+        if app_fields is None:
+            return
+        name_edit = app_fields["name_edit"]
+        if not name_edit.isHidden() or name_edit.text().strip() != name:
+            app_fields["save_name"]()
+        if not app_fields["cmd_edit"].isHidden():
+            app_fields["save_command"]()
+
+    def covers_folder(self):
+        if self.json_file_path:
+            return os.path.join(os.path.dirname(self.json_file_path), "covers")
+        if not self.covers_location:
+            self.covers_location = QFileDialog.getExistingDirectory(self, "Choose Where to Store the Covers Folder")
+            if not self.covers_location:
+                QMessageBox.warning(self, "No Location Selected", "Covers were not fetched. Choose a location for the covers folder to download them.")
+                return None
+        return os.path.join(self.covers_location, "covers")
+
+    def collect_sorted_apps(self, progress_dialog):
         reordered_apps = []
+        cover_apps = []
+        reset_covers_indexes()
+        for i in range(self.list_widget.count()):
+            if progress_dialog.wasCanceled():
+                QMessageBox.warning(self, "Canceled", "The operation was canceled.")
+                return None
+            list_item = self.list_widget.item(i)
+            item_widget = self.list_widget.itemWidget(list_item)
+            progress_dialog.setValue(i)
+            name_label = item_widget.layout().itemAt(1).widget()
+            self.commit_pending_edits(name_label.text())
+            app = self.apps_by_name.get(name_label.text())
+            if app is None:
+                continue
+            if name_label.text() not in self.dirty_names:
+                reordered_apps.append(app)
+                continue
+            app_fields = self.cmd_edits[name_label.text()]
+            name_edit = app_fields["name_edit"]
+            cmd_edit = app_fields["cmd_edit"]
+            updated_name = name_edit.text().strip() or name_label.text()
+            updated_cmd = cmd_edit.text().strip()
+            self.rename_app(name_label.text(), updated_name)
+            app["cmd"] = updated_cmd
+            if updated_name in SPECIAL_IMAGES:
+                app["image-path"] = SPECIAL_IMAGES[updated_name]
+            elif cover_needs_refresh(app, fresh=True):
+                if self.download_covers:
+                    cover_apps.append(app)
+                else:
+                    app["image-path"] = None
+                    covers_logger.debug("Cleared image-path for %s as downloading is disabled.", updated_name)
+            else:
+                covers_logger.debug("Image-path for %s is up-to-date: %s", updated_name, app.get("image-path"))
+            reordered_apps.append(app)
+        if cover_apps and not self.fetch_covers(cover_apps, progress_dialog):
+            return None
+        return reordered_apps
+
+    def fetch_covers(self, apps, progress_dialog):
+        api_key = self.config.get("api_key")
+        if not api_key:
+            covers_logger.error("SteamGridDB API Key is not configured.")
+            QMessageBox.warning(self, "Configuration Error", "SteamGridDB API Key is missing. Please configure the settings.")
+            return True
+        image_dir = self.covers_folder()
+        if not image_dir:
+            return True
+        queue = CoverJobQueue()
+        client = SteamGridDBClient(api_key)
+        missing = 0
+        def wait_for_worker():
+            QThread.msleep(int(COVER_JOB_POLL_INTERVAL * 1000))
+            QApplication.processEvents()
+            return not progress_dialog.wasCanceled()
+        try:
+            queue.enqueue_many((image_dir, app["name"], self.steam_appids.get(app["name"])) for app in apps)
+            progress_dialog.setLabelText("Fetching covers, this may take a few minutes...")
+            progress_dialog.setMaximum(len(apps))
+            for i, app in enumerate(apps):
+                if progress_dialog.wasCanceled():
+                    QMessageBox.warning(self, "Canceled", "The operation was canceled. Remaining covers will keep downloading in the background.")
+                    start_cover_worker(api_key)
+                    return False
+                progress_dialog.setValue(i)
+                image_path = fetch_cover(queue, client, image_dir, app["name"], wait_for_worker)
+                if image_path:
+                    app["image-path"] = image_path.replace("/", "\\")
+                    get_covers_index(image_dir).add(image_path)
+                    covers_logger.debug("Updated image-path for %s: %s", app["name"], image_path)
+                else:
+                    missing += 1
+                    covers_logger.warning("No image found for %s", app["name"])
+        finally:
+            client.close()
+            queue.close()
+        if missing:
+            QMessageBox.warning(self, "Missing Covers", f"{missing} cover(s) could not be fetched. See Cover Jobs for details; failed downloads are retried in the background.")
+            start_cover_worker(api_key)
+        return True
+
+    def create_progress_dialog(self):
         progress_dialog = QProgressDialog("Please wait, this may take a few minutes...", "Cancel", 0, self.list_widget.count(), self)
         progress_dialog.setWindowTitle("Processing")
         progress_dialog.setWindowModality(Qt.WindowModal)
         progress_dialog.setMinimumDuration(0)
         progress_dialog.setValue(0)
+        return progress_dialog
+
+    def save_sorted_json(self):
+        if not self.ensure_json_file_path():
+            return
+        progress_dialog = self.create_progress_dialog()
         try:
-            for i in range(self.list_widget.count()):
-                if progress_dialog.wasCanceled():
-                    QMessageBox.warning(self, "Canceled", "The operation was canceled.")
-                    return
-                list_item = self.list_widget.item(i)
-                item_widget = self.list_widget.itemWidget(list_item)
-                progress_dialog.setValue(i)
-                name_label = item_widget.layout().itemAt(1).widget()
-                app_fields = self.cmd_edits[name_label.text()]
-                name_edit = app_fields["name_edit"]
-                cmd_edit = app_fields["cmd_edit"]
-                updated_name = name_edit.text().strip()
-                updated_cmd = cmd_edit.text().strip()
-                for app in self.apps:
-                    if app.get("name") == name_label.text():
-                        app["name"] = updated_name
-                        app["cmd"] = updated_cmd
-                        if updated_name == "Desktop":
-                            app["image-path"] = "desktop.png"
-                        elif updated_name == "Steam Big Picture":
-                            app["image-path"] = "steam.png"
-                        else:
-                            current_image_path = app.get("image-path", "")
-                            expected_image_name = f"{updated_name}.png"
-                            if (
-                                not current_image_path or
-                                os.path.basename(current_image_path) != expected_image_name or
-                                not os.path.exists(current_image_path)
-                            ):
-                                if self.download_covers:
-                                    logging.debug(f"Fetching new cover for: {updated_name}")
-                                    image_path = self.fetch_game_image(updated_name)
-                                    if image_path:
-                                        app["image-path"] = image_path.replace("/", "\\")
-                                        logging.debug(f"Updated image-path for {updated_name}: {image_path}")
-                                    else:
-                                        logging.warning(f"No image found for {updated_name}")
-                                else:
-                                    app["image-path"] = None
-                                    logging.debug(f"Cleared image-path for {updated_name} as downloading is disabled.")
-                            else:
-                                logging.debug(f"Image-path for {updated_name} is up-to-date: {current_image_path}")
-                        reordered_apps.append(app)
-                        break
+            reordered_apps = self.collect_sorted_apps(progress_dialog)
+            if reordered_apps is None:
+                return
             with open(self.json_file_path, "w") as f:
                 json.dump({"env": "", "apps": reordered_apps}, f, indent=4)
+            remember_cover_usage(reordered_apps)
+            self.dirty_names.clear()
             progress_dialog.setValue(progress_dialog.maximum())
             progress_dialog.close()
             QMessageBox.information(self, "Success", f"Configuration saved to {self.json_file_path}")
             self.accept()
         except Exception as e:
-            logging.error(f"Failed to save JSON: {e}")
+            ui_logger.error("Failed to save JSON: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to save configuration: {e}")
         finally:
             progress_dialog.setValue(self.list_widget.count())
             progress_dialog.close()
 
-    def fetch_game_image(self, game_name):
-        api_key = self.config.get("api_key")
-        sanitized_name = re.sub(r'[^a-zA-Z0-9 \- \.]', '', game_name)
-        if not api_key:
-            logging.error("SteamGridDB API Key is not configured.")
-            QMessageBox.warning(self, "Configuration Error", "SteamGridDB API Key is missing. Please configure the settings.")
-            return None
-        url = f"https://www.steamgriddb.com/api/v2/search/autocomplete/{sanitized_name}"
-        headers = {"Authorization": f"Bearer {api_key}"}
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            results = response.json().get("data", [])
-            logging.debug(f"SteamGridDB response for {game_name}: {results}")
-            if results:
-                game_id = results[0]["id"]
-                return self.download_cover(game_id, sanitized_name, api_key)
-        except Exception as e:
-            logging.error(f"Failed to fetch game data for {game_name}: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to fetch game data for {game_name}: {e}")
-        return None
-
-    def download_cover(self, game_id, game_name, api_key):
-        acceptable_sizes = [(600, 900), (342, 482)]
-        url = f"https://www.steamgriddb.com/api/v2/grids/game/{game_id}"
-        headers = {"Authorization": f"Bearer {api_key}"}
+    def push_to_sunshine(self):
+        progress_dialog = self.create_progress_dialog()
+        client = SunshineAPIClient.from_config(self.config)
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            grids = response.json().get("data", [])
-            logging.debug(f"Grid data for {game_name}: {grids}")
-            if grids:
-                valid_grids = [
-                    grid for grid in grids
-                    if (grid.get("width"), grid.get("height")) in acceptable_sizes
-                ]
-                if not valid_grids:
-                    logging.warning(f"No valid cover art sizes found for {game_name}.")
-                    return None
-                image_url = valid_grids[0]["url"]
-                response = requests.get(image_url, stream=True)
-                response.raise_for_status()
-                image_dir = os.path.join(os.path.dirname(self.json_file_path), "covers")
-                os.makedirs(image_dir, exist_ok=True)
-                png_path = os.path.join(image_dir, f"{game_name}.png")
-                with open(png_path, "wb") as f:
-                    f.write(response.content)
-                logging.info(f"Image saved as PNG for {game_name} at {png_path}")
-                return png_path
+            reordered_apps = self.collect_sorted_apps(progress_dialog)
+            if reordered_apps is None:
+                return
+            operations = client.push_apps(reordered_apps)
+            remember_cover_usage(reordered_apps)
+            self.dirty_names.clear()
+            progress_dialog.setValue(progress_dialog.maximum())
+            progress_dialog.close()
+            QMessageBox.information(self, "Success", f"Pushed {len(operations)} change(s) to Sunshine at {client.base_url}")
         except Exception as e:
-            logging.error(f"Failed to download or save cover for {game_name}: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to download or save cover for {game_name}: {e}")
-        return None
+            sunshine_logger.error("Failed to push apps to Sunshine: %s", e)
+            QMessageBox.critical(self, "Error", f"Failed to push apps to Sunshine: {e}")
+        finally:
+            client.close()
+            progress_dialog.setValue(self.list_widget.count())
+            progress_dialog.close()
 
 class NoScrollComboBox(QComboBox):
     def wheelEvent(self, event):
@@ -388,6 +1483,22 @@ class FolderScannerApp(QWidget):
         load_sort_button = QPushButton("Load and Sort JSON")
         load_sort_button.clicked.connect(self.load_and_sort_json)
         self.layout.addWidget(load_sort_button)
+        cover_jobs_button = QPushButton("Cover Jobs")
+        cover_jobs_button.clicked.connect(self.open_cover_jobs)
+        self.layout.addWidget(cover_jobs_button)
+        filter_layout = QHBoxLayout()
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter entries by name, folder or executable (use ^ for name prefix)...")
+        self.filter_edit.textChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.filter_edit)
+        self.filter_combo = NoScrollComboBox()
+        self.filter_combo.addItems(["All", "Has Selection", "No Selection", "Missing Cover"])
+        self.filter_combo.currentTextChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.filter_combo)
+        self.layout.addLayout(filter_layout)
+        self.search_index = SearchIndex()
+        self.entry_widgets = {}
+        self.section_labels = {}
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_content = QWidget()
@@ -404,6 +1515,12 @@ class FolderScannerApp(QWidget):
         self.clear_covers_foldertoggle = False
         self.loaded_json_path = None
         self.covers_folder = None
+        config = load_config_file()
+        if config.get("download_covers", True):
+            start_cover_worker(config.get("api_key"))
+
+    def open_cover_jobs(self):
+        CoverJobsDialog(self).exec_()
 
     def clear_covers_folder(self):
         covers_dir = os.path.dirname(self.loaded_json_path)
@@ -419,18 +1536,61 @@ class FolderScannerApp(QWidget):
             if reply == QMessageBox.Yes:
                 try:
                     shutil.rmtree(self.covers_folder)
-                    logging.info("Covers folder cleared successfully.")
+                    reset_covers_indexes()
+                    covers_logger.info("Covers folder cleared successfully.")
                     QMessageBox.information(self, "Success", "Covers folder cleared!")
                     self.covers_folder = None
                     self.update_gui()
                 except Exception as e:
-                    logging.error(f"Failed to clear covers folder: {e}")
+                    covers_logger.error("Failed to clear covers folder: %s", e)
                     QMessageBox.critical(self, "Error", f"Failed to clear covers folder: {e}")
             else:
-                logging.info("Covers folder clearance canceled by the user.")
+                covers_logger.info("Covers folder clearance canceled by the user.")
         else:
             QMessageBox.information(self, "Information", "Covers folder does not exist.")
 
+    def clean_up_covers_folder(self):
+        covers_folder = os.path.join(os.path.dirname(self.loaded_json_path), "covers")
+        if not os.path.exists(covers_folder):
+            QMessageBox.information(self, "Information", "Covers folder does not exist.")
+            return
+        try:
+            apps = load_apps_file(self.loaded_json_path)
+        except Exception as e:
+            covers_logger.error("Failed to read %s for cover cleanup: %s", self.loaded_json_path, e)
+            QMessageBox.critical(self, "Error", f"Failed to read {self.loaded_json_path}: {e}")
+            return
+        apps.extend(data for subfolders in self.executables.values() for data in subfolders.values())
+        quota_bytes = load_config_file().get("covers_quota_mb", 0) * 1024 * 1024
+        reset_covers_indexes()
+        index = get_covers_index(covers_folder)
+        index.set_references(apps)
+        queue = CoverJobQueue()
+        try:
+            index.set_last_used(queue.cover_usage())
+        finally:
+            queue.close()
+        doomed = index.plan_garbage_collection(quota_bytes)
+        if not doomed:
+            QMessageBox.information(self, "Information", "No covers need to be removed.")
+            return
+        unreferenced = sum(1 for cover in doomed if not cover["apps"])
+        size_mb = sum(cover["size"] for cover in doomed) / (1024 * 1024)
+        reply = QMessageBox.question(
+            self,
+            "Confirm Cleanup",
+            f"Remove {len(doomed)} cover(s) ({size_mb:.1f} MB): {unreferenced} not used by any app and "
+            f"{len(doomed) - unreferenced} least recently used to stay within the quota?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            covers_logger.info("Covers cleanup canceled by the user.")
+            return
+        removed = index.remove(doomed)
+        covers_logger.info("Removed %s cover(s) from %s.", len(removed), covers_folder)
+        QMessageBox.information(self, "Success", f"Removed {len(removed)} cover(s).")
+
     def clear_list(self):
         self.executables.clear()
         self.base_folders.clear()
@@ -454,7 +1614,7 @@ class FolderScannerApp(QWidget):
         try:
             with open(file_path, "r") as f:
                 config = json.load(f)
-            logging.debug(f"Loaded JSON: {config}")
+            load_logger.debug("Loaded JSON: %s", config)
             if not isinstance(config, dict):
                 raise ValueError("Invalid JSON format: Root is not a dictionary.")
             if "apps" not in config:
@@ -488,11 +1648,12 @@ class FolderScannerApp(QWidget):
             }
             for key, entry in special_entries.items():
                 self.executables["Special"][key] = entry
+            steam_manifests = {}
             for index, app in enumerate(config["apps"]):
                 if not isinstance(app, dict):
-                    logging.warning(f"Skipping invalid app at index {index}: {app}")
+                    load_logger.warning("Skipping invalid app at index %s: %s", index, app)
                     continue
-                logging.debug(f"Processing app at index {index}: {app}")
+                load_logger.debug("Processing app at index %s: %s", index, app)
                 name = app.get("name", "Unnamed App")
                 if name in special_entries:
                     continue
@@ -501,24 +1662,24 @@ class FolderScannerApp(QWidget):
                 working_dir = os.path.normpath(app.get("working-dir", "").strip("\"")) if app.get("working-dir") else ""
                 exe_files = ["Skip"]
                 if working_dir and os.path.exists(working_dir):
-                    for root, _, files in os.walk(working_dir):
-                        exe_files.extend(
-                            os.path.normpath(os.path.join(root, file)) 
-                            for file in files 
-                            if file.endswith(".exe") and not any(keyword in file.lower() for keyword in FILTER_KEYWORDS)
-                        )
-                    exe_files = sorted(set(exe_files))
+                    exe_files = sorted(find_executables(working_dir) | {"Skip"})
                 if cmd and cmd not in exe_files:
                     exe_files.append(cmd)
                 exe_files = ["Skip"] + [item for item in exe_files if item != "Skip"]
+                dirty = cover_needs_refresh({"name": name, "image-path": image_path})
                 if working_dir:
                     base_folder = os.path.dirname(working_dir)
+                    if base_folder not in steam_manifests:
+                        steam_manifests[base_folder] = read_steam_manifests(base_folder)
+                    manifest = steam_manifests[base_folder].get(os.path.basename(working_dir).lower(), {})
                     self.executables.setdefault(base_folder, {})
                     self.executables[base_folder][working_dir] = {
                         "exe_files": exe_files,
                         "selected_exe": cmd if cmd in exe_files else "Skip",
                         "image-path": image_path,
-                        "name": name
+                        "name": name,
+                        "steam_appid": manifest.get("appid"),
+                        "dirty": dirty
                     }
                 else:
                     self.executables.setdefault("Miscellaneous", {})
@@ -526,7 +1687,8 @@ class FolderScannerApp(QWidget):
                         "exe_files": exe_files,
                         "selected_exe": cmd if cmd in exe_files else "Skip",
                         "image-path": image_path,
-                        "name": name
+                        "name": name,
+                        "dirty": dirty
                     }
                 progress_dialog.setValue(index + 1)
                 QApplication.processEvents()
@@ -541,7 +1703,7 @@ class FolderScannerApp(QWidget):
             self.clear_covers_foldertoggle = True
             self.update_gui()
         except Exception as e:
-            logging.error(f"Failed to load JSON: {e}")
+            load_logger.error("Failed to load JSON: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to load JSON: {e}")
 
     def load_and_sort_json(self):
@@ -552,13 +1714,13 @@ class FolderScannerApp(QWidget):
                     config = json.load(f)
                 if "apps" in config:
                     apps = config["apps"]
-                    logging.info(f"Loaded {len(apps)} apps from {file_path}")
+                    load_logger.info("Loaded %s apps from %s", len(apps), file_path)
                     sort_dialog = SortDialog(apps, None, self)
                     sort_dialog.exec_()
                 else:
                     QMessageBox.warning(self, "Invalid JSON", "The selected JSON file does not contain an 'apps' key.")
             except Exception as e:
-                logging.error(f"Failed to load JSON file: {e}")
+                load_logger.error("Failed to load JSON file: %s", e)
                 QMessageBox.critical(self, "Error", f"Failed to load JSON file: {e}")
 
     def select_folders(self):
@@ -599,31 +1761,19 @@ class FolderScannerApp(QWidget):
         for entry in special_entries:
             self.executables["Special"][entry["name"]] = entry
         processed_subfolders = 0
+        def update_progress(subfolder_path):
+            nonlocal processed_subfolders
+            processed_subfolders += 1
+            progress_dialog.setValue(processed_subfolders)
+            QApplication.processEvents()
+            return not progress_dialog.wasCanceled()
         for folder in self.base_folders:
             folder = os.path.normpath(folder)
-            self.executables.setdefault(folder, {})
-            for subfolder in os.listdir(folder):
-                subfolder_path = os.path.normpath(os.path.join(folder, subfolder))
-                if os.path.isdir(subfolder_path):
-                    exe_files = []
-                    for root, _, files in os.walk(subfolder_path):
-                        exe_files.extend(
-                            os.path.normpath(os.path.join(root, f)) for f in files
-                            if f.endswith('.exe') and not any(kw in f.lower() for kw in FILTER_KEYWORDS)
-                        )
-                    exe_files = list(set(exe_files))
-                    self.executables[folder][subfolder_path] = {
-                        "exe_files": ["Skip"] + exe_files,
-                        "selected_exe": "Skip",
-                        "image-path": "",
-                        "name": os.path.basename(subfolder_path)
-                    }
-                    processed_subfolders += 1
-                    progress_dialog.setValue(processed_subfolders)
-                    QApplication.processEvents()
-                    if progress_dialog.wasCanceled():
-                        progress_dialog.close()
-                        return
+            entries = scan_base_folder(folder, progress=update_progress)
+            if entries is None:
+                progress_dialog.close()
+                return
+            self.executables.setdefault(folder, {}).update(entries)
         self.clean_up_special_entries()
         progress_dialog.close()
         self.update_gui()
@@ -634,67 +1784,90 @@ class FolderScannerApp(QWidget):
             if widget:
                 widget.deleteLater()
         self.scroll_layout.setAlignment(Qt.AlignTop)
+        self.search_index.clear()
+        self.entry_widgets.clear()
+        self.section_labels.clear()
         special_entries = self.executables.get("Special", {})
         if special_entries:
-            base_label = QLabel("Special Entries")
-            base_label.setStyleSheet("font-weight: bold; color: #FFD700;")
-            base_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            self.scroll_layout.addWidget(base_label)
+            self.add_section_label("Special", "Special Entries", "font-weight: bold; color: #FFD700;")
             for name, data in special_entries.items():
-                subfolder_label = QLabel(f"Entry: {data['name']}")
-                subfolder_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self.scroll_layout.addWidget(subfolder_label)
-                combo_box = NoScrollComboBox()
-                combo_box.addItems(data["exe_files"])
-                combo_box.setCurrentText(data["selected_exe"])
-                combo_box.currentTextChanged.connect(partial(self.update_selected_exe, data))
-                combo_box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self.scroll_layout.addWidget(combo_box)
+                self.add_entry_widgets("Special", name, data)
         manual_entries = self.executables.get("Manual Entries", {})
         if manual_entries:
-            base_label = QLabel("Manual Entries")
-            base_label.setStyleSheet("font-weight: bold; color: #32CD32;")
-            base_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            self.scroll_layout.addWidget(base_label)
+            self.add_section_label("Manual Entries", "Manual Entries", "font-weight: bold; color: #32CD32;")
             for name, data in manual_entries.items():
-                subfolder_label = QLabel(f"Entry: {data['name']}")
-                subfolder_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self.scroll_layout.addWidget(subfolder_label)
-                combo_box = NoScrollComboBox()
-                combo_box.addItems(data["exe_files"])
-                combo_box.setCurrentText(data["selected_exe"])
-                combo_box.currentTextChanged.connect(partial(self.update_selected_exe, data))
-                combo_box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self.scroll_layout.addWidget(combo_box)
+                self.add_entry_widgets("Manual Entries", name, data)
         for base_folder, subfolders in self.executables.items():
             if base_folder in {"Special", "Manual Entries"}:
                 continue
-            base_label = QLabel("Base Folder: " + base_folder.replace("/", "\\"))
-            base_label.setStyleSheet("font-weight: bold;")
-            base_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            self.scroll_layout.addWidget(base_label)
+            self.add_section_label(base_folder, "Base Folder: " + base_folder.replace("/", "\\"), "font-weight: bold;")
             for key, data in subfolders.items():
-                subfolder_label = QLabel(f"Entry: {data['name']}")
-                subfolder_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self.scroll_layout.addWidget(subfolder_label)
-                combo_box = NoScrollComboBox()
-                combo_box.addItems(data["exe_files"])
-                combo_box.setCurrentText(data["selected_exe"])
-                combo_box.currentTextChanged.connect(partial(self.update_selected_exe, data))
-                combo_box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self.scroll_layout.addWidget(combo_box)
+                self.add_entry_widgets(base_folder, key, data)
+        self.apply_filter()
         if self.clear_covers_foldertoggle:
             if not hasattr(self, 'clearcovers_button') or self.clearcovers_button is None:
                 self.clearcovers_button = QPushButton("Clear Covers Folder")
                 self.clearcovers_button.clicked.connect(self.clear_covers_folder)
                 self.layout.addWidget(self.clearcovers_button)
+                self.cleanupcovers_button = QPushButton("Clean Up Covers Folder")
+                self.cleanupcovers_button.clicked.connect(self.clean_up_covers_folder)
+                self.layout.addWidget(self.cleanupcovers_button)
             else:
                 self.layout.removeWidget(self.clearcovers_button)
                 self.clearcovers_button.deleteLater()
                 self.clearcovers_button = None
+                self.layout.removeWidget(self.cleanupcovers_button)
+                self.cleanupcovers_button.deleteLater()
+                self.cleanupcovers_button = None
+
+    def add_section_label(self, category, text, style):
+        base_label = QLabel(text)
+        base_label.setStyleSheet(style)
+        base_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.scroll_layout.addWidget(base_label)
+        self.section_labels[category] = base_label
+
+    def add_entry_widgets(self, category, key, data):
+        subfolder_label = QLabel(f"Entry: {data['name']}")
+        subfolder_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.scroll_layout.addWidget(subfolder_label)
+        combo_box = NoScrollComboBox()
+        combo_box.addItems(data["exe_files"])
+        combo_box.setCurrentText(data["selected_exe"])
+        combo_box.currentTextChanged.connect(partial(self.update_selected_exe, data))
+        combo_box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.scroll_layout.addWidget(combo_box)
+        self.entry_widgets[(category, key)] = (data, subfolder_label, combo_box)
+        self.search_index.add((category, key), data["name"], category, *data["exe_files"][1:])
+
+    def apply_filter(self, *args):
+        matches = self.search_index.search(self.filter_edit.text())
+        mode = self.filter_combo.currentText()
+        visible_sections = set()
+        self.scroll_content.setUpdatesEnabled(False)
+        for (category, key), (data, subfolder_label, combo_box) in self.entry_widgets.items():
+            visible = (category, key) in matches
+            if visible and mode == "Has Selection":
+                visible = data["selected_exe"] != "Skip"
+            elif visible and mode == "No Selection":
+                visible = data["selected_exe"] == "Skip"
+            elif visible and mode == "Missing Cover":
+                visible = cover_needs_refresh(data)
+            if visible:
+                visible_sections.add(category)
+            if subfolder_label.isHidden() == visible:
+                subfolder_label.setVisible(visible)
+                combo_box.setVisible(visible)
+        unfiltered = not self.filter_edit.text().strip() and mode == "All"
+        for category, base_label in self.section_labels.items():
+            visible = unfiltered or category in visible_sections
+            if base_label.isHidden() == visible:
+                base_label.setVisible(visible)
+        self.scroll_content.setUpdatesEnabled(True)
 
     def update_selected_exe(self, subfolder_data, selected_exe):
         subfolder_data["selected_exe"] = selected_exe
+        subfolder_data["dirty"] = True
 
     def add_manual_entry(self):
         dialog = AddManualEntryDialog(self)
@@ -708,53 +1881,86 @@ class FolderScannerApp(QWidget):
                     "working-dir": manual_entry["working-dir"],
                     "image-path": manual_entry["image-path"],
                     "exe_files": ["Skip", manual_entry["cmd"]],
-                    "selected_exe": manual_entry["cmd"]
+                    "selected_exe": manual_entry["cmd"],
+                    "dirty": True
                 }
                 self.update_gui()
                 QMessageBox.information(self, "Success", f"Manual entry '{manual_entry['name']}' added successfully!")
 
+    def find_duplicate_installs(self):
+        selected = {}
+        for base_folder, subfolders in self.executables.items():
+            if base_folder == "Special":
+                continue
+            for subfolder_path, data in subfolders.items():
+                if data["selected_exe"] != "Skip":
+                    selected.setdefault(os.path.normpath(data["selected_exe"]), (subfolder_path, data))
+        progress_dialog = QProgressDialog("Checking for duplicate installs, please wait...", None, 0, 0, self)
+        progress_dialog.setWindowTitle("Please Wait")
+        progress_dialog.setCancelButtonText("Cancel")
+        progress_dialog.setWindowModality(Qt.ApplicationModal)
+        progress_dialog.setMinimumDuration(0)
+        def update_progress(hashed, total):
+            progress_dialog.setMaximum(total)
+            progress_dialog.setValue(hashed)
+            QApplication.processEvents()
+            return not progress_dialog.wasCanceled()
+        try:
+            duplicates = find_duplicate_files(selected, progress=update_progress)
+        finally:
+            progress_dialog.close()
+        if duplicates is None:
+            scan_logger.info("Duplicate install check was canceled.")
+            return []
+        identities = {
+            path: {"name": data["name"], "steam_appid": data.get("steam_appid"), "exe": path}
+            for path, (_, data) in selected.items()
+        }
+        return [[selected[path] for path in group] for group in confirm_duplicate_games(duplicates, identities)]
+
     def save_configuration(self):
         flat_apps = []
         added_keys = set()
+        dirty_names = set()
+        steam_appids = {}
+        skipped_entries = set()
+        duplicates = self.find_duplicate_installs()
+        if duplicates:
+            scan_logger.warning("Found %s duplicate install(s) among selected executables.", len(duplicates))
+            details = "\n\n".join(
+                "\n".join(f"{data['name']}: {data['selected_exe']}" for _, data in group)
+                for group in duplicates
+            )
+            reply = QMessageBox.question(
+                self,
+                "Duplicate Installs Found",
+                f"{len(duplicates)} game(s) are installed more than once:\n\n{details}\n\nKeep only the first install of each?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            if reply == QMessageBox.Yes:
+                skipped_entries = {id(data) for group in duplicates for _, data in group[1:]}
         for base_folder, subfolders in self.executables.items():
             for subfolder_path, data in subfolders.items():
-                if data["selected_exe"] == "Skip":
+                if data["selected_exe"] == "Skip" or id(data) in skipped_entries:
                     continue
                 key = data.get("name", subfolder_path)
                 if key in added_keys:
                     continue
-                if base_folder == "Special" and data["selected_exe"] == "Include":
-                    flat_apps.append({
-                        "name": data["name"],
-                        "cmd": None,
-                        "exclude-global-prep-cmd": "false",
-                        "elevated": "false",
-                        "auto-detach": "false",
-                        "wait-all": "true",
-                        "exit-timeout": "5",
-                        "image-path": data.get("image-path", ""),
-                        "working-dir": None
-                    })
-                    added_keys.add(data["name"])
-                else:
-                    flat_apps.append({
-                        "name": data.get("name", os.path.basename(subfolder_path)),
-                        "cmd": "\"" + data["selected_exe"].replace("/", "\\") + "\"",
-                        "exclude-global-prep-cmd": "false",
-                        "elevated": "false",
-                        "auto-detach": "false",
-                        "wait-all": "true",
-                        "exit-timeout": "5",
-                        "image-path": "\"" + data.get("image-path", subfolder_path).replace("/", "\\") + "\"",
-                        "working-dir": "\"" + data.get("working-dir", subfolder_path).replace("/", "\\") + "\""
-                    })
-                    added_keys.add(key)
+                flat_apps.append(build_app_entry(base_folder, subfolder_path, data))
+                added_keys.add(key)
+                if data.get("dirty", True):
+                    dirty_names.add(flat_apps[-1]["name"])
+                if data.get("steam_appid"):
+                    steam_appids[flat_apps[-1]["name"]] = data["steam_appid"]
         for app in self.loaded_apps:
             key = app.get("name")
             if key not in added_keys:
                 flat_apps.append(app)
                 added_keys.add(key)
-        sort_dialog = SortDialog(flat_apps, None, self)
+                if cover_needs_refresh(app):
+                    dirty_names.add(key)
+        sort_dialog = SortDialog(flat_apps, None, self, dirty_names, steam_appids)
         sort_dialog.exec_()
     
 class AddManualEntryDialog(QDialog):
@@ -841,12 +2047,252 @@ class AddManualEntryDialog(QDialog):
     def get_manual_entry(self):
         return self.manual_entry
 
+class ScanCache:
+    def __init__(self, path=SCAN_CACHE_FILE):
+        self.connection = sqlite3.connect(path, timeout=30)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS tree_scans (path TEXT PRIMARY KEY, dir_mtimes TEXT NOT NULL, exe_files TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def tree_unchanged(dir_mtimes):
+        for directory, mtime in dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def find_executables(self, folder):
+        row = self.connection.execute("SELECT dir_mtimes, exe_files FROM tree_scans WHERE path = ?", (folder,)).fetchone()
+        if row and self.tree_unchanged(json.loads(row[0])):
+            return set(json.loads(row[1]))
+        exe_files, dir_mtimes = walk_executables(folder)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO tree_scans (path, dir_mtimes, exe_files) VALUES (?, ?, ?)",
+                (folder, json.dumps(dir_mtimes), json.dumps(sorted(exe_files)))
+            )
+        return exe_files
+
+    def close(self):
+        self.connection.close()
+
+def scan_base_folder(folder, scan_cache=None, progress=None):
+    folder = os.path.normpath(folder)
+    steam_manifests = read_steam_manifests(folder)
+    find = scan_cache.find_executables if scan_cache else find_executables
+    entries = {}
+    for entry in sorted(os.scandir(folder), key=lambda entry: entry.name.lower()):
+        if not entry.is_dir():
+            continue
+        subfolder_path = os.path.normpath(entry.path)
+        manifest = steam_manifests.get(entry.name.lower(), {})
+        entries[subfolder_path] = {
+            "exe_files": ["Skip"] + sorted(find(subfolder_path)),
+            "selected_exe": "Skip",
+            "image-path": "",
+            "name": manifest.get("name", entry.name),
+            "steam_appid": manifest.get("appid"),
+            "dirty": True
+        }
+        if progress is not None and not progress(subfolder_path):
+            return None
+    return entries
+
+def pick_default_exe(name, exe_files):
+    candidates = [exe for exe in exe_files if exe != "Skip"]
+    if not candidates:
+        return "Skip"
+    wanted = normalize_game_name(name)
+    for exe in candidates:
+        if normalize_game_name(os.path.splitext(os.path.basename(exe))[0]) == wanted:
+            return exe
+    def file_size(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return -1
+    return max(candidates, key=file_size)
+
+def unquote_path(value):
+    return os.path.normpath(value.strip("\"")) if value and value.strip("\"") else ""
+
+def load_apps_file(path):
+    with open(path, "r") as f:
+        config = json.load(f)
+    if not isinstance(config, dict) or not isinstance(config.get("apps"), list):
+        raise ValueError(f"Invalid JSON format in {path}: missing 'apps' list.")
+    return [app for app in config["apps"] if isinstance(app, dict)]
+
+def fetch_profile_covers(apps, steam_appids, image_dir, settings, summary):
+    needed = [app for app in apps if cover_needs_refresh(app)]
+    if not needed:
+        return
+    queue = CoverJobQueue(settings["cover_jobs"])
+    client = SteamGridDBClient(settings["api_key"])
+    try:
+        cache_dir = settings["cover_cache"]
+        queue.enqueue_many((cache_dir, app["name"], steam_appids.get(app["name"])) for app in needed)
+        for app in needed:
+            cached_path = fetch_cover(queue, client, cache_dir, app["name"])
+            if not cached_path:
+                summary["missing_covers"] += 1
+                continue
+            image_path = os.path.join(image_dir, os.path.basename(cached_path))
+            with open(cached_path, "rb") as f:
+                write_file_atomically(image_path, f.read())
+            app["image-path"] = image_path.replace("/", "\\")
+            summary["covers"] += 1
+    finally:
+        client.close()
+        queue.close()
+
+def run_profile(profile, settings):
+    started = time.perf_counter()
+    summary = {
+        "profile": profile.get("name") or profile["output"],
+        "apps": 0,
+        "added": 0,
+        "duplicates": 0,
+        "covers": 0,
+        "missing_covers": 0,
+        "seconds": 0.0,
+        "error": None
+    }
+    scan_cache = ScanCache(settings["scan_cache"]) if settings.get("scan_cache") else None
+    try:
+        apps = load_apps_file(profile["apps_json"]) if profile.get("apps_json") and os.path.exists(profile["apps_json"]) else []
+        known_dirs = {unquote_path(app.get("working-dir")) for app in apps}
+        new_entries = []
+        for folder in profile.get("base_folders", []):
+            for subfolder_path, data in scan_base_folder(folder, scan_cache).items():
+                if subfolder_path in known_dirs:
+                    continue
+                data["selected_exe"] = pick_default_exe(data["name"], data["exe_files"])
+                if data["selected_exe"] != "Skip":
+                    new_entries.append((os.path.normpath(folder), subfolder_path, data))
+        identities = {}
+        for app in apps:
+            if app.get("cmd"):
+                path = unquote_path(app["cmd"])
+                identities[path] = {"name": app.get("name"), "steam_appid": None, "exe": path}
+        existing_cmds = set(identities)
+        for _, _, data in new_entries:
+            identities[data["selected_exe"]] = {"name": data["name"], "steam_appid": data.get("steam_appid"), "exe": data["selected_exe"]}
+        dropped = {}
+        for group in confirm_duplicate_games(find_duplicate_files(list(identities)), identities):
+            keep = next((path for path in group if path in existing_cmds), group[0])
+            dropped.update((path, keep) for path in group if path != keep)
+        names = {app.get("name") for app in apps}
+        steam_appids = {}
+        for base_folder, subfolder_path, data in new_entries:
+            if data["selected_exe"] in dropped:
+                batch_logger.warning(
+                    "Profile %s: skipped %s (%s), it is a duplicate install of %s.",
+                    summary["profile"], data["selected_exe"], data["name"], dropped[data["selected_exe"]]
+                )
+                summary["duplicates"] += 1
+                continue
+            if data["name"] in names:
+                continue
+            apps.append(build_app_entry(base_folder, subfolder_path, data))
+            names.add(data["name"])
+            if data.get("steam_appid"):
+                steam_appids[data["name"]] = data["steam_appid"]
+            summary["added"] += 1
+        output = profile["output"]
+        if profile.get("download_covers", settings["download_covers"]) and settings.get("api_key"):
+            image_dir = os.path.join(os.path.dirname(os.path.abspath(output)), "covers")
+            fetch_profile_covers(apps, steam_appids, image_dir, settings, summary)
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, "w") as f:
+            json.dump({"env": "", "apps": apps}, f, indent=4)
+        remember_cover_usage(apps, settings["cover_jobs"])
+        summary["apps"] = len(apps)
+    except Exception as e:
+        batch_logger.error("Profile %s failed: %s", summary["profile"], e)
+        summary["error"] = str(e)
+    finally:
+        if scan_cache:
+            scan_cache.close()
+    summary["seconds"] = time.perf_counter() - started
+    return summary
+
+def init_batch_worker(log_queue, levels):
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    set_log_levels(levels)
+
+def run_batch(manifest_path, workers=None):
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    def resolve(path):
+        return os.path.join(base_dir, path) if path and not os.path.isabs(path) else path
+    config = load_config_file()
+    settings = {
+        "api_key": manifest.get("api_key") or config.get("api_key"),
+        "download_covers": manifest.get("download_covers", config.get("download_covers", True)),
+        "cover_cache": resolve(manifest.get("cover_cache", COVER_CACHE_FOLDER)),
+        "cover_jobs": resolve(manifest.get("cover_jobs", COVER_JOBS_FILE)),
+        "scan_cache": resolve(manifest.get("scan_cache", SCAN_CACHE_FILE))
+    }
+    profiles = []
+    for profile in manifest.get("profiles", []):
+        profile = dict(profile)
+        profile["base_folders"] = [resolve(folder) for folder in profile.get("base_folders", [])]
+        profile["apps_json"] = resolve(profile.get("apps_json"))
+        profile["output"] = resolve(profile.get("output") or profile.get("apps_json"))
+        if not profile["output"]:
+            raise ValueError(f"Profile {profile.get('name', len(profiles))} has no output path.")
+        profiles.append(profile)
+    CoverJobQueue(settings["cover_jobs"]).close()
+    if settings["scan_cache"]:
+        ScanCache(settings["scan_cache"]).close()
+    started = time.perf_counter()
+    results = []
+    log_queue = multiprocessing.Queue()
+    log_listener = QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+    log_listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker, initargs=(log_queue, log_levels_from_config(config))) as pool:
+            futures = [pool.submit(run_profile, profile, settings) for profile in profiles]
+            for future in as_completed(futures):
+                summary = future.result()
+                results.append(summary)
+                status = f"ERROR: {summary['error']}" if summary["error"] else "OK"
+                print(
+                    f"{summary['profile']:<24} {summary['apps']:>5} apps {summary['added']:>5} new "
+                    f"{summary['duplicates']:>4} duplicates {summary['covers']:>5} covers "
+                    f"({summary['missing_covers']} missing) {summary['seconds']:>7.1f}s  {status}",
+                    flush=True
+                )
+    finally:
+        log_listener.stop()
+        log_queue.close()
+    failed = sum(1 for summary in results if summary["error"])
+    print(f"{len(results)} profile(s) in {time.perf_counter() - started:.1f}s, {failed} failed.")
+    return 1 if failed else 0
+
 def main():
+    parser = argparse.ArgumentParser(description="NeonSunshine")
+    parser.add_argument("--batch", metavar="MANIFEST", help="generate configs for every host profile in MANIFEST and exit")
+    parser.add_argument("--workers", type=int, help="number of processes used in batch mode (default: one per core)")
+    args = parser.parse_args()
     signal.signal(signal.SIGINT, signal.SIG_DFL)
+    configure_logging(load_config_file())
+    if args.batch:
+        sys.exit(run_batch(args.batch, args.workers))
     app = QApplication([])
     window = FolderScannerApp()
     window.showMaximized()
     app.exec_()
+    stop_cover_worker()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
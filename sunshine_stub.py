@@ -0,0 +1,148 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse, base64, json, ssl, threading
+
+class SunshineStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def authorized(self):
+        credentials = self.server.credentials
+        if not credentials:
+            return True
+        expected = "Basic " + base64.b64encode(f"{credentials[0]}:{credentials[1]}".encode("utf-8")).decode("ascii")
+        if self.headers.get("Authorization") == expected:
+            return True
+        self.send_json(401, {"status": False, "error": "Unauthorized"})
+        return False
+
+    def record(self):
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path))
+
+    def do_GET(self):
+        self.record()
+        if not self.authorized():
+            return
+        if self.path != "/api/apps":
+            self.send_json(404, {"status": False, "error": "Not Found"})
+            return
+        with self.server.lock:
+            self.send_json(200, {"env": {}, "apps": list(self.server.apps)})
+
+    def do_POST(self):
+        self.record()
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if not self.authorized():
+            return
+        if self.path != "/api/apps":
+            self.send_json(404, {"status": False, "error": "Not Found"})
+            return
+        index = payload.pop("index", -1)
+        with self.server.lock:
+            if index == -1:
+                self.server.apps.append(payload)
+            elif 0 <= index < len(self.server.apps):
+                self.server.apps[index] = payload
+            else:
+                self.send_json(400, {"status": False, "error": f"Invalid index {index}"})
+                return
+        self.send_json(200, {"status": True})
+
+    def do_DELETE(self):
+        self.record()
+        if not self.authorized():
+            return
+        prefix = "/api/apps/"
+        if not self.path.startswith(prefix) or not self.path[len(prefix):].isdigit():
+            self.send_json(404, {"status": False, "error": "Not Found"})
+            return
+        index = int(self.path[len(prefix):])
+        with self.server.lock:
+            if index >= len(self.server.apps):
+                self.send_json(400, {"status": False, "error": f"Invalid index {index}"})
+                return
+            del self.server.apps[index]
+        self.send_json(200, {"status": True})
+
+class SunshineStubServer:
+    def __init__(self, apps=None, host="127.0.0.1", port=0, credentials=None, certfile=None, keyfile=None):
+        self.httpd = ThreadingHTTPServer((host, port), SunshineStubHandler)
+        self.httpd.apps = list(apps or [])
+        self.httpd.requests = []
+        self.httpd.credentials = credentials
+        self.httpd.lock = threading.Lock()
+        self.scheme = "http"
+        if certfile:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+            self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+            self.scheme = "https"
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"{self.scheme}://{host}:{port}"
+
+    @property
+    def apps(self):
+        return self.httpd.apps
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Sunshine /api/apps endpoints.")
+    parser.add_argument("apps_json", nargs="?", help="apps.json to serve initially")
+    parser.add_argument("--port", type=int, default=47990)
+    parser.add_argument("--username")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--certfile")
+    parser.add_argument("--keyfile")
+    args = parser.parse_args()
+    apps = []
+    if args.apps_json:
+        with open(args.apps_json, "r") as f:
+            apps = json.load(f).get("apps", [])
+    credentials = (args.username, args.password) if args.username else None
+    server = SunshineStubServer(apps, port=args.port, credentials=credentials, certfile=args.certfile, keyfile=args.keyfile)
+    print(f"Serving {len(apps)} apps at {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
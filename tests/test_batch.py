@@ -0,0 +1,56 @@
+import json
+import logging
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import NSS
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+@pytest.fixture
+def handler(monkeypatch):
+    handler = RecordingHandler()
+    monkeypatch.setattr(NSS.logger, "handlers", [handler])
+    yield handler
+
+def test_worker_logs_reach_parent_handlers(tmp_path, monkeypatch, handler):
+    monkeypatch.chdir(tmp_path)
+    game = tmp_path / "games" / "Game"
+    game.mkdir(parents=True)
+    (game / "Game.exe").write_bytes(b"exe")
+    manifest = {
+        "download_covers": False,
+        "profiles": [
+            {"name": "good", "base_folders": ["games"], "output": "good/apps.json"},
+            {"name": "broken", "base_folders": ["missing"], "output": "broken/apps.json"}
+        ]
+    }
+    (tmp_path / "hosts.json").write_text(json.dumps(manifest))
+    assert NSS.run_batch(str(tmp_path / "hosts.json"), workers=2) == 1
+    apps = json.loads((tmp_path / "good" / "apps.json").read_text())["apps"]
+    assert [app["name"] for app in apps] == ["Game"]
+    errors = [record for record in handler.records if record.name == "NSS.batch"]
+    assert len(errors) == 1 and "broken" in errors[0].getMessage()
+
+def test_batch_skips_only_same_game_duplicates_and_logs_them(tmp_path, monkeypatch, handler):
+    monkeypatch.chdir(tmp_path)
+    for folder, exe in [("Game", "Game.exe"), ("Game Copy", "Game.exe"), ("Other", "Other.exe")]:
+        (tmp_path / "games" / folder).mkdir(parents=True)
+        (tmp_path / "games" / folder / exe).write_bytes(b"same engine stub")
+    (tmp_path / "NSS-config.json").write_text(json.dumps({"log_levels": "batch=WARNING"}))
+    manifest = {"download_covers": False, "profiles": [{"name": "host", "base_folders": ["games"], "output": "host/apps.json"}]}
+    (tmp_path / "hosts.json").write_text(json.dumps(manifest))
+    assert NSS.run_batch(str(tmp_path / "hosts.json"), workers=1) == 0
+    apps = json.loads((tmp_path / "host" / "apps.json").read_text())["apps"]
+    names = [app["name"] for app in apps]
+    assert len(names) == 2 and "Other" in names
+    warnings = [record.getMessage() for record in handler.records if record.levelno == logging.WARNING]
+    skipped = ({"Game", "Game Copy"} - set(names)).pop()
+    assert len(warnings) == 1 and f"({skipped})" in warnings[0]
@@ -0,0 +1,102 @@
+import os
+import threading
+import time
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import NSS
+
+class FakeClient:
+    def __init__(self):
+        self.downloads = []
+        self.lock = threading.Lock()
+
+    def resolve_game_id(self, game_name, steam_appid=None):
+        return 1
+
+    def download_cover(self, game_id, game_name, image_dir):
+        with self.lock:
+            self.downloads.append(game_name)
+        time.sleep(0.05)
+        png_path = os.path.join(image_dir, f"{NSS.sanitize_cover_name(game_name)}.png")
+        NSS.write_file_atomically(png_path, b"png")
+        return png_path
+
+@pytest.fixture
+def jobs_file(tmp_path):
+    return str(tmp_path / "jobs.sqlite3")
+
+def test_claim_is_exclusive(jobs_file, tmp_path):
+    first, second = NSS.CoverJobQueue(jobs_file), NSS.CoverJobQueue(jobs_file)
+    first.enqueue_many([(str(tmp_path), "Game", None)])
+    job = first.get(str(tmp_path), "Game")
+    assert first.claim(job)["state"] == "running"
+    assert second.claim(job) is None
+    assert second.claim_next() is None
+    first.close()
+    second.close()
+
+def test_stale_claim_can_be_taken_over(jobs_file, tmp_path):
+    queue = NSS.CoverJobQueue(jobs_file)
+    queue.enqueue_many([(str(tmp_path), "Game", None)])
+    job = queue.claim(queue.get(str(tmp_path), "Game"))
+    queue.update(job, claimed_at=time.time() - NSS.COVER_JOB_CLAIM_TIMEOUT - 1)
+    assert queue.claim_next()["name"] == "Game"
+    queue.close()
+
+def test_concurrent_fetches_download_each_cover_once(jobs_file, tmp_path):
+    image_dir = str(tmp_path / "covers")
+    names = [f"Game {i}" for i in range(8)]
+    NSS.CoverJobQueue(jobs_file).close()
+    client = FakeClient()
+    results = []
+    def fetch_all():
+        queue = NSS.CoverJobQueue(jobs_file)
+        queue.enqueue_many((image_dir, name, None) for name in names)
+        results.append([NSS.fetch_cover(queue, client, image_dir, name) for name in names])
+        queue.close()
+    threads = [threading.Thread(target=fetch_all) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(client.downloads) == sorted(names)
+    assert all(result == results[0] and all(result) for result in results)
+    assert sorted(os.listdir(image_dir)) == sorted(f"{name}.png" for name in names)
+
+def test_worker_waits_for_backoff_instead_of_exiting(tmp_path, monkeypatch):
+    from PyQt5.QtWidgets import QApplication
+    QApplication.instance() or QApplication([])
+    monkeypatch.chdir(tmp_path)
+    client = FakeClient()
+    client.close = lambda: None
+    monkeypatch.setattr(NSS, "SteamGridDBClient", lambda api_key: client)
+    image_dir = str(tmp_path / "covers")
+    queue = NSS.CoverJobQueue()
+    queue.enqueue_many([(image_dir, "Game", None)])
+    job = queue.get(image_dir, "Game")
+    queue.update(job, state="failed", attempts=1, next_attempt=time.time() + 0.5)
+    worker = NSS.CoverWorker("key")
+    worker.start()
+    assert worker.wait(10000)
+    assert client.downloads == ["Game"]
+    assert queue.get(image_dir, "Game")["state"] == "done"
+    queue.close()
+
+def test_claim_left_by_dead_process_is_reclaimed(jobs_file, tmp_path):
+    import socket
+    import subprocess
+    import sys
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    queue = NSS.CoverJobQueue(jobs_file)
+    queue.enqueue_many([(str(tmp_path), "Game", None)])
+    job = queue.get(str(tmp_path), "Game")
+    queue.update(job, state="running", claimed_at=time.time(), claimed_by=f"{socket.gethostname()}:{dead.pid}")
+    assert queue.claim_next()["name"] == "Game"
+    client = FakeClient()
+    queue.update(job, state="running", claimed_at=time.time(), claimed_by=f"{socket.gethostname()}:{dead.pid}")
+    assert NSS.fetch_cover(queue, client, str(tmp_path), "Game", wait=lambda: pytest.fail("waited on a dead claim"))
+    assert client.downloads == ["Game"]
+    queue.close()
@@ -0,0 +1,37 @@
+import os
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import NSS
+
+def test_quota_evicts_least_recently_referenced_cover(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    covers = tmp_path / "covers"
+    covers.mkdir()
+    apps = []
+    for name, mtime in [("Old", 3000), ("Middle", 2000), ("New", 1000)]:
+        path = covers / f"{name}.png"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (mtime, mtime))
+        apps.append({"name": name, "image-path": str(path).replace("/", "\\")})
+    monkeypatch.setattr(NSS.time, "time", lambda: 5000)
+    NSS.remember_cover_usage(apps[:2])
+    monkeypatch.setattr(NSS.time, "time", lambda: 6000)
+    NSS.remember_cover_usage(apps[1:])
+    index = NSS.CoversIndex(str(covers))
+    index.set_references(apps)
+    queue = NSS.CoverJobQueue()
+    index.set_last_used(queue.cover_usage())
+    queue.close()
+    assert [cover["name"] for cover in index.plan_garbage_collection(quota_bytes=200)] == ["Old.png"]
+    assert [cover["name"] for cover in index.plan_garbage_collection(quota_bytes=1)][0] == "Old.png"
+
+def test_unreferenced_covers_are_always_removed(tmp_path):
+    covers = tmp_path / "covers"
+    covers.mkdir()
+    (covers / "Gone.png").write_bytes(b"x")
+    (covers / "Kept.png").write_bytes(b"x")
+    index = NSS.CoversIndex(str(covers))
+    index.set_references([{"name": "Kept", "image-path": str(covers / "Kept.png")}])
+    assert [cover["name"] for cover in index.plan_garbage_collection()] == ["Gone.png"]
@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import NSS
+
+@pytest.fixture
+def installs(tmp_path, monkeypatch):
+    monkeypatch.setattr(NSS, "HASH_BLOCK_SIZE", 16)
+    monkeypatch.setattr(NSS, "HASH_CHUNK_SIZE", 16)
+    paths = []
+    for name, content in [("a", b"x" * 100), ("b", b"x" * 100), ("c", b"x" * 50 + b"y" * 50), ("d", b"z" * 10)]:
+        path = tmp_path / name / "game.exe"
+        path.parent.mkdir()
+        path.write_bytes(content)
+        paths.append(str(path))
+    return paths
+
+def test_reports_progress_and_finds_duplicates(installs):
+    calls = []
+    duplicates = NSS.find_duplicate_files(installs, progress=lambda hashed, total: calls.append((hashed, total)) or True)
+    assert duplicates == [sorted(installs[:2])]
+    assert calls[-1] == (5, 5)
+
+def test_cancel_returns_none(installs):
+    assert NSS.find_duplicate_files(installs, progress=lambda hashed, total: False) is None
+
+def identity(path, name, steam_appid=None):
+    return {"name": name, "steam_appid": steam_appid, "exe": path}
+
+def test_identical_bytes_of_different_games_are_not_duplicates():
+    group = ["C:/A/Game.exe", "C:/B/Player.exe", "C:/C/Other.exe"]
+    identities = {
+        group[0]: identity(group[0], "Alpha"),
+        group[1]: identity(group[1], "Beta"),
+        group[2]: identity(group[2], "Gamma")
+    }
+    assert NSS.confirm_duplicate_games([group], identities) == []
+
+def test_duplicates_need_a_shared_appid_name_or_exe_name():
+    group = ["C:/A/alpha.exe", "C:/B/Launcher.exe", "C:/C/launcher.exe", "D:/A/bin.exe", "E:/X/x.exe"]
+    identities = {
+        group[0]: identity(group[0], "Alpha: Remastered", "10"),
+        group[1]: identity(group[1], "Beta"),
+        group[2]: identity(group[2], "Gamma"),
+        group[3]: identity(group[3], "alpha remastered"),
+        group[4]: identity(group[4], "Delta", "20")
+    }
+    assert NSS.confirm_duplicate_games([group], identities) == [
+        ["C:/A/alpha.exe", "D:/A/bin.exe"],
+        ["C:/B/Launcher.exe", "C:/C/launcher.exe"]
+    ]
+
+def test_different_steam_appids_are_never_duplicates():
+    group = ["C:/A/game.exe", "C:/B/game.exe"]
+    identities = {group[0]: identity(group[0], "Game", "1"), group[1]: identity(group[1], "Game", "2")}
+    assert NSS.confirm_duplicate_games([group], identities) == []
@@ -0,0 +1,22 @@
+import logging
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import NSS
+
+@pytest.fixture(autouse=True)
+def restore_levels():
+    yield
+    NSS.set_log_levels({})
+
+def test_parse_log_levels():
+    assert NSS.parse_log_levels("debug, covers=info,scan = warning") == {"*": "DEBUG", "covers": "INFO", "scan": "WARNING"}
+
+def test_invalid_levels_are_skipped(caplog):
+    with caplog.at_level(logging.ERROR, logger="NSS"):
+        NSS.set_log_levels(NSS.parse_log_levels("covers=VERBOSE,scan=DEBUG,gpu=DEBUG"))
+    assert NSS.scan_logger.level == logging.DEBUG
+    assert NSS.covers_logger.level == logging.NOTSET
+    assert NSS.logger.level == logging.ERROR
+    assert "VERBOSE" in caplog.text and "gpu" in caplog.text
@@ -0,0 +1,35 @@
+import os
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import NSS
+
+def touch(path, mtime):
+    os.utime(path, (mtime, mtime))
+
+def test_nested_changes_invalidate_cached_scan(tmp_path):
+    game = tmp_path / "Game"
+    (game / "bin" / "x64").mkdir(parents=True)
+    (game / "bin" / "x64" / "game.exe").write_bytes(b"")
+    (game / "unins000.exe").write_bytes(b"")
+    for directory in (game, game / "bin", game / "bin" / "x64"):
+        touch(directory, 1000)
+    cache = NSS.ScanCache(str(tmp_path / "scan.sqlite3"))
+    exe = os.path.normpath(str(game / "bin" / "x64" / "game.exe"))
+    assert cache.find_executables(str(game)) == {exe}
+    (game / "bin" / "x64" / "launcher.exe").write_bytes(b"")
+    touch(game, 1000)
+    touch(game / "bin", 1000)
+    assert cache.find_executables(str(game)) == {exe, os.path.normpath(str(game / "bin" / "x64" / "launcher.exe"))}
+    cache.close()
+
+def test_unchanged_tree_is_served_from_cache(tmp_path, monkeypatch):
+    game = tmp_path / "Game"
+    (game / "bin").mkdir(parents=True)
+    (game / "bin" / "game.exe").write_bytes(b"")
+    cache = NSS.ScanCache(str(tmp_path / "scan.sqlite3"))
+    first = cache.find_executables(str(game))
+    monkeypatch.setattr(NSS, "walk_executables", lambda folder: pytest.fail("tree was rescanned"))
+    assert cache.find_executables(str(game)) == first
+    cache.close()
@@ -0,0 +1,29 @@
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtWidgets import QApplication
+import NSS
+
+@pytest.fixture
+def library(tmp_path):
+    for folder, exes in [("Beta", ["beta.exe", "Alpha Tool.exe"]), ("Alpha", ["alpha.exe"])]:
+        (tmp_path / "games" / folder).mkdir(parents=True)
+        for exe in exes:
+            (tmp_path / "games" / folder / exe).write_bytes(b"exe")
+    return tmp_path / "games"
+
+def test_scanner_window_uses_scan_base_folder(library, tmp_path, monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.chdir(tmp_path)
+    window = NSS.FolderScannerApp()
+    window.base_folders.append(str(library))
+    window.scan_folders()
+    assert window.executables[str(library)] == NSS.scan_base_folder(str(library))
+    window.close()
+    app.processEvents()
+
+def test_scan_can_be_canceled(library):
+    seen = []
+    assert NSS.scan_base_folder(str(library), progress=lambda path: seen.append(path) and False) is None
+    assert len(seen) == 1
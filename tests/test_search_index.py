@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import NSS
+
+ENTRIES = {
+    1: ("Alpha Protocol", "C:\\Games\\Alpha Protocol", "alpha.exe"),
+    2: ("Half-Life 2", "D:\\Steam\\steamapps\\common\\Half-Life 2", "hl2.exe"),
+    3: ("Portal", "D:\\Steam\\steamapps\\common\\Portal", "portal.exe"),
+    4: ("The Talos Principle", "E:\\Games\\Talos", "Talos.exe"),
+    5: ("Celeste", None, "C:\\Games\\Celeste\\Celeste.exe"),
+    6: ("", None, None)
+}
+
+def build_index():
+    index = NSS.SearchIndex()
+    for key, (name, *fields) in ENTRIES.items():
+        index.add(key, name, *fields)
+    return index
+
+def fresh_search(query):
+    return build_index().search(query)
+
+def typed(query):
+    return [query[:length] for length in range(len(query) + 1)]
+
+@pytest.mark.parametrize("query", ["portal", "al", "^ha", "^the tal", "steam ^p", "games exe ^c", "^", "a ^", "talos  principle", "zzz"])
+def test_typing_and_deleting_match_a_fresh_search(query):
+    index = build_index()
+    for partial in typed(query) + list(reversed(typed(query))):
+        assert index.search(partial) == fresh_search(partial), partial
+
+def test_switching_queries_matches_a_fresh_search():
+    index = build_index()
+    for query in ["^p", "^po", "pa", "^h", "half ^p", "half", "HALF-life", "^"]:
+        assert index.search(query) == fresh_search(query), query
+
+def test_prefix_terms_only_match_the_start_of_the_name():
+    index = build_index()
+    assert index.search("^talos") == set()
+    assert index.search("^the") == {4}
+    assert index.search("talos") == {4}
+    assert index.search("") == set(ENTRIES)
+
+def test_add_and_remove_reset_cached_results():
+    index = build_index()
+    assert index.search("al") == {1, 2, 3, 4}
+    index.add(7, "Alan Wake", "F:\\Games\\Alan Wake")
+    assert index.search("ala") == {7}
+    index.remove(7)
+    assert index.search("alan") == set()
+    index.add(1, "Beta Protocol")
+    assert index.search("alph") == set()
+    index.clear()
+    assert index.search("a") == set()
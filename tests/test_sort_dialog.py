@@ -0,0 +1,112 @@
+import json
+import os
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtWidgets import QApplication, QFileDialog, QMessageBox
+import NSS
+
+@pytest.fixture
+def dialog(tmp_path, monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.chdir(tmp_path)
+    for method in ("information", "warning", "critical"):
+        monkeypatch.setattr(QMessageBox, method, lambda *args, **kwargs: QMessageBox.Ok)
+    (tmp_path / "NSS-config.json").write_text(json.dumps({"download_covers": False}))
+    apps = [
+        {"name": "Alpha", "cmd": "\"C:\\Games\\Alpha\\alpha.exe\"", "image-path": "covers\\Alpha.png"},
+        {"name": "Beta", "cmd": "\"C:\\Games\\Beta\\beta.exe\"", "image-path": "covers\\Beta.png"}
+    ]
+    sort_dialog = NSS.SortDialog(apps, str(tmp_path / "apps.json"), None, dirty_names=set())
+    yield sort_dialog
+    sort_dialog.close()
+    app.processEvents()
+
+def saved_apps(dialog):
+    with open(dialog.json_file_path) as f:
+        return json.load(f)["apps"]
+
+def test_rename_being_typed_is_saved(dialog):
+    fields = dialog.cmd_edits["Beta"]
+    fields["name_label"].mousePressEvent(None)
+    fields["name_edit"].setText("Beta Remastered")
+    dialog.save_sorted_json()
+    assert [app["name"] for app in saved_apps(dialog)] == ["Alpha", "Beta Remastered"]
+    assert fields["name_label"].text() == "Beta Remastered"
+
+def test_command_being_typed_is_saved(dialog):
+    fields = dialog.cmd_edits["Alpha"]
+    fields["cmd_edit"].setVisible(True)
+    fields["cmd_edit"].setText("\"C:\\Games\\Alpha\\alpha-dx12.exe\"")
+    dialog.save_sorted_json()
+    assert saved_apps(dialog)[0]["cmd"] == "\"C:\\Games\\Alpha\\alpha-dx12.exe\""
+    assert saved_apps(dialog)[1]["cmd"] == "\"C:\\Games\\Beta\\beta.exe\""
+
+class FakeCoverClient:
+    def __init__(self, api_key):
+        pass
+
+    def resolve_game_id(self, game_name, steam_appid=None):
+        return 1
+
+    def download_cover(self, game_id, game_name, image_dir):
+        png_path = os.path.join(image_dir, f"{NSS.sanitize_cover_name(game_name)}.png")
+        NSS.write_file_atomically(png_path, b"png")
+        return png_path
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def push_dialog(tmp_path, monkeypatch):
+    from sunshine_stub import SunshineStubServer
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.chdir(tmp_path)
+    for method in ("information", "warning", "critical"):
+        monkeypatch.setattr(QMessageBox, method, lambda *args, **kwargs: QMessageBox.Ok)
+    monkeypatch.setattr(QFileDialog, "getSaveFileName", lambda *args, **kwargs: pytest.fail("asked for a save file"))
+    monkeypatch.setattr(NSS, "SteamGridDBClient", FakeCoverClient)
+    server = SunshineStubServer().start()
+    (tmp_path / "NSS-config.json").write_text(json.dumps({"download_covers": True, "api_key": "key", "sunshine_url": server.url}))
+    def make(apps, dirty_names):
+        return NSS.SortDialog(apps, None, None, dirty_names=dirty_names)
+    yield make, server
+    server.stop()
+    app.processEvents()
+
+def test_push_without_new_covers_asks_for_nothing(push_dialog, monkeypatch):
+    make, server = push_dialog
+    monkeypatch.setattr(QFileDialog, "getExistingDirectory", lambda *args, **kwargs: pytest.fail("asked for a folder"))
+    dialog = make([{"name": "Desktop", "image-path": "desktop.png"}], set())
+    dialog.push_to_sunshine()
+    assert [app["name"] for app in server.apps] == ["Desktop"]
+    dialog.close()
+
+def test_push_asks_for_covers_location_only_when_fetching(push_dialog, monkeypatch, tmp_path):
+    make, server = push_dialog
+    asked = []
+    monkeypatch.setattr(QFileDialog, "getExistingDirectory", lambda *args, **kwargs: asked.append(args) or str(tmp_path / "sunshine"))
+    dialog = make([{"name": "Alpha", "cmd": "alpha.exe"}], {"Alpha"})
+    dialog.push_to_sunshine()
+    dialog.push_to_sunshine()
+    assert len(asked) == 1
+    assert server.apps[0]["image-path"] == str(tmp_path / "sunshine" / "covers" / "Alpha.png").replace("/", "\\")
+    dialog.close()
+
+def test_special_entries_get_their_image_back(tmp_path, monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.chdir(tmp_path)
+    for method in ("information", "warning", "critical"):
+        monkeypatch.setattr(QMessageBox, method, lambda *args, **kwargs: QMessageBox.Ok)
+    (tmp_path / "NSS-config.json").write_text(json.dumps({"download_covers": False}))
+    apps = [
+        {"name": "Desktop", "image-path": ""},
+        {"name": "Steam Big Picture", "cmd": "steam://open/bigpicture", "image-path": "steam.png"}
+    ]
+    sort_dialog = NSS.SortDialog(apps, str(tmp_path / "apps.json"))
+    assert sort_dialog.dirty_names == {"Desktop"}
+    sort_dialog.save_sorted_json()
+    assert [app["image-path"] for app in saved_apps(sort_dialog)] == ["desktop.png", "steam.png"]
+    sort_dialog.close()
+    app.processEvents()
@@ -0,0 +1,79 @@
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import requests
+import NSS
+
+MANIFEST = r'''
+"AppState"
+{
+	"appid"		"1245620"
+	"name"		"The \"Quoted\" Ring"
+	"installdir"		"ELDEN RING"
+	"UserConfig"
+	{
+		"language"		"english"
+		"BetaKey"		"public"
+	}
+	"MountedDepots"
+	{
+		"1245621"		"2853442148232145543"
+	}
+}
+}
+'''
+
+def test_parse_acf_nested_blocks_and_escapes():
+    app_state = NSS.parse_acf(MANIFEST)["AppState"]
+    assert app_state["name"] == 'The "Quoted" Ring'
+    assert app_state["UserConfig"] == {"language": "english", "BetaKey": "public"}
+    assert app_state["MountedDepots"] == {"1245621": "2853442148232145543"}
+
+def test_parse_acf_tolerates_unbalanced_braces():
+    assert NSS.parse_acf('"A" { "b" "1" } } "C" "2" {') == {"A": {"b": "1"}, "C": "2"}
+
+@pytest.fixture
+def steam_library(tmp_path):
+    common = tmp_path / "steamapps" / "common"
+    (common / "Elden Ring" / "Game").mkdir(parents=True)
+    (common / "Elden Ring" / "Game" / "eldenring.exe").write_bytes(b"exe")
+    (common / "Unmanaged").mkdir()
+    (tmp_path / "steamapps" / "appmanifest_1245620.acf").write_text(MANIFEST)
+    (tmp_path / "steamapps" / "appmanifest_0.acf").write_text('"AppState" { "name" "No install dir" }')
+    return common
+
+def test_manifests_are_matched_by_install_dir(steam_library):
+    manifests = NSS.read_steam_manifests(str(steam_library))
+    assert list(manifests) == ["elden ring"]
+    assert manifests["elden ring"]["name"] == 'The "Quoted" Ring'
+    assert manifests["elden ring"]["appid"] == "1245620"
+    entries = NSS.scan_base_folder(str(steam_library))
+    assert {data["name"]: data["steam_appid"] for data in entries.values()} == {'The "Quoted" Ring': "1245620", "Unmanaged": None}
+
+def test_manifests_need_a_steamapps_common_folder(steam_library):
+    assert NSS.read_steam_manifests(str(steam_library.parent)) == {}
+
+def test_resolve_game_id_prefers_steam_app_id(monkeypatch):
+    client = NSS.SteamGridDBClient("key")
+    paths = []
+    def get_json(path):
+        paths.append(path)
+        return {"data": {"id": 42}}
+    monkeypatch.setattr(client, "get_json", get_json)
+    assert client.resolve_game_id("Elden Ring", "1245620") == 42
+    assert paths == ["games/steam/1245620"]
+    client.close()
+
+def test_resolve_game_id_falls_back_to_search(monkeypatch):
+    client = NSS.SteamGridDBClient("key")
+    paths = []
+    def get_json(path):
+        paths.append(path)
+        if path.startswith("games/steam/"):
+            raise requests.HTTPError("404 Client Error")
+        return {"data": [{"id": 7}, {"id": 8}]}
+    monkeypatch.setattr(client, "get_json", get_json)
+    assert client.resolve_game_id("Elden Ring: Deluxe", "1245620") == 7
+    assert paths == ["games/steam/1245620", "search/autocomplete/Elden Ring Deluxe"]
+    client.close()
@@ -0,0 +1,89 @@
+import random
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from NSS import SunshineAPIClient, diff_sunshine_apps, sunshine_app_matches
+from sunshine_stub import SunshineStubServer
+
+def make_apps(count):
+    return [{"name": f"Game {i}", "cmd": f"\"C:\\Games\\Game {i}\\game.exe\"", "wait-all": "true"} for i in range(count)]
+
+@pytest.fixture(scope="module")
+def server():
+    with SunshineStubServer(credentials=("user", "pass")) as server:
+        yield server
+
+@pytest.fixture
+def push(server):
+    def push(remote_apps, apps):
+        server.apps[:] = [dict(app) for app in remote_apps]
+        server.requests.clear()
+        client = SunshineAPIClient(server.url, "user", "pass")
+        try:
+            operations = client.push_apps(apps)
+        finally:
+            client.close()
+        assert [app["name"] for app in server.apps] == [app["name"] for app in apps]
+        assert all(sunshine_app_matches(remote, app) for remote, app in zip(server.apps, apps))
+        return operations, list(server.requests)
+    return push
+
+def test_unchanged_list_only_reads(push):
+    apps = make_apps(50)
+    operations, requests = push(apps, [dict(app) for app in apps])
+    assert operations == []
+    assert requests == [("GET", "/api/apps")]
+
+def test_rename_is_one_request(push):
+    apps = make_apps(50)
+    target = [dict(app) for app in apps]
+    target[10]["name"] = "Renamed"
+    _, requests = push(apps, target)
+    assert requests[1:] == [("POST", "/api/apps")]
+
+def test_add_is_one_request(push):
+    apps = make_apps(50)
+    _, requests = push(apps, apps + [{"name": "New Game", "cmd": "\"C:\\new.exe\""}])
+    assert requests[1:] == [("POST", "/api/apps")]
+
+def test_delete_is_one_request(push):
+    apps = make_apps(50)
+    _, requests = push(apps, apps[:10] + apps[11:])
+    assert requests[1:] == [("DELETE", "/api/apps/10")]
+
+def test_move_to_end_is_delete_and_add(push):
+    apps = make_apps(5)
+    _, requests = push(apps, apps[1:] + apps[:1])
+    assert requests[1:] == [("DELETE", "/api/apps/0"), ("POST", "/api/apps")]
+
+def test_swap_updates_both_slots(push):
+    apps = make_apps(5)
+    target = list(apps)
+    target[1], target[3] = target[3], target[1]
+    _, requests = push(apps, target)
+    assert len(requests) == 3
+
+def test_duplicate_local_name(push):
+    apps = make_apps(5)
+    push(apps, apps + [apps[0]])
+
+def test_duplicate_remote_name_is_deleted(push):
+    apps = make_apps(5)
+    operations, _ = push(apps + [apps[0]], apps)
+    assert [action for action, _, _ in operations] == ["delete"]
+
+def test_random_changes_converge(push):
+    rng = random.Random(26)
+    apps = make_apps(30)
+    for _ in range(25):
+        target = [dict(app) for app in rng.sample(apps, rng.randint(0, 30))]
+        target += [dict(rng.choice(apps)) for _ in range(rng.randint(0, 3))]
+        for app in rng.sample(target, min(len(target), 3)):
+            app["cmd"] = "\"C:\\changed.exe\""
+        push(apps, target)
+
+def test_diff_never_exceeds_full_rewrite():
+    apps = make_apps(20)
+    target = list(reversed(apps))
+    assert len(diff_sunshine_apps(apps, target)) <= len(target)